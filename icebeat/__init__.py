@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 
 import aiosqlite
 import uvloop
@@ -14,6 +15,8 @@ __all__ = ["main"]
 
 
 async def _launch(conf: config.Config) -> None:
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     async with aiosqlite.connect(conf.database.uri) as sqlite_conn:
         cache = TimedCache(conf.cache.entries, conf.cache.ttl)
         storage = SQLiteStorage(sqlite_conn)
@@ -92,15 +92,17 @@ class IceBeat(commands.Bot):
     async def _verify_whitelisted_guilds(self) -> None:
         whitelist = await self.store.get_whitelist()
 
+        missing_guild_ids = []
         for guild_id in whitelist.guild_ids:
             try:
                 await self.fetch_guild_preview(guild_id)
             except discord.NotFound:
-                await self.store.remove_from_whitelist(guild_id)
+                missing_guild_ids.append(guild_id)
 
-                __log__.info(
-                    f"Server {guild_id} was removed from whitelist as I couldn't find it on Discord"
-                )
+        for guild_id in await self.store.remove_many_from_whitelist(missing_guild_ids):
+            __log__.info(
+                f"Server {guild_id} was removed from whitelist as I couldn't find it on Discord"
+            )
 
         async for guild in self.fetch_guilds(limit=None):
             if guild.id not in whitelist.guild_ids:
@@ -110,6 +112,8 @@ class IceBeat(commands.Bot):
         whitelist = await self.store.get_whitelist()
         whitelisted_guilds = [Object(id=guild_id) for guild_id in whitelist.guild_ids]
 
+        await self.store.warm_up_guilds(whitelist.guild_ids)
+
         await self.add_cog(Music(self), guilds=whitelisted_guilds)
 
         for whitelisted_guild in whitelisted_guilds:
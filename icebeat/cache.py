@@ -47,7 +47,7 @@ class TimedCache(Cache):
         self._cache.pop(key, default=None)
 
     def get_guild(self, guild_id: int) -> Optional[Guild]:
-        self._cache.get(guild_id, None)
+        return self._cache.get(guild_id, None)
 
     def set_guild(self, guild: Guild) -> None:
         self._cache[guild.id] = guild
@@ -56,7 +56,7 @@ class TimedCache(Cache):
         self._pop(guild_id)
 
     def get_whitelist(self) -> Optional[Whitelist]:
-        self._cache.get("whitelist", None)
+        return self._cache.get("whitelist", None)
 
     def set_whitelist(self, whitelist: Whitelist) -> None:
         self._cache["whitelist"] = whitelist
@@ -0,0 +1,48 @@
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from discord import Embed
+
+__all__ = ["ErrorEmbedBuilder", "ErrorEmbedBuilders", "static_error_embed"]
+
+_C = TypeVar("_C")
+
+ErrorEmbedBuilder = Callable[[Any, _C], Embed | None]
+
+
+def static_error_embed(embed: Embed | None) -> ErrorEmbedBuilder[Any]:
+    def builder(error: Any, context: Any) -> Embed | None:
+        _, _ = error, context
+
+        return embed
+
+    return builder
+
+
+class ErrorEmbedBuilders(Generic[_C]):
+    __slots__ = ("_builders", "_resolved")
+
+    def __init__(self, builders: dict[type[Exception], ErrorEmbedBuilder[_C]]) -> None:
+        self._builders = builders
+        self._resolved: dict[type[Exception], ErrorEmbedBuilder[_C] | None] = {}
+
+    def resolve(self, error_type: type[Exception]) -> ErrorEmbedBuilder[_C] | None:
+        # Builders may be keyed by a base class (e.g. the Guild converter
+        # raises a BadArgument subclass), so the error's MRO is walked once
+        # per type and the result is memoized.
+        try:
+            return self._resolved[error_type]
+        except KeyError:
+            pass
+
+        builder = next(
+            (
+                self._builders[base]
+                for base in error_type.__mro__
+                if base in self._builders
+            ),
+            None,
+        )
+        self._resolved[error_type] = builder
+
+        return builder
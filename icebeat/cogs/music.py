@@ -1,6 +1,6 @@
 import asyncio
+from functools import lru_cache
 import logging
-import re
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 from attr import dataclass
 from typing_extensions import override
@@ -18,7 +18,6 @@ from discord import (
     Role,
     VoiceChannel,
     VoiceState,
-    Webhook,
     app_commands,
     errors,
 )
@@ -32,6 +31,7 @@ from icebeat.ui import InteractionPagination, Page, compute_total_pages
 from icebeat.voice import LavalinkVoiceClient
 
 
+from .errors import ErrorEmbedBuilders, static_error_embed
 from ..model import Filter
 from ..player import IceBeatPlayer, Queue
 from ..treesync import (
@@ -42,6 +42,8 @@ from ..treesync import (
 )
 
 if TYPE_CHECKING:
+    from discord import Webhook
+
     from ..bot import IceBeat
 
 __all__ = ["Music"]
@@ -50,38 +52,68 @@ __log__ = logging.getLogger(__name__)
 
 
 _MAX_DISCORD_TEXT_LINK_SIZE = 55
-_URL_RE = re.compile(r"^https?://(?:www\.)?.+")
-_SEEK_TIME_RE = re.compile(
-    r"^(((?P<hours>[1-9]\d*):(?P<mins_h>\d{2}))|(?P<mins_m>[1-9]{0,1}\d)):(?P<secs>\d{2})$"
-)
-_QUERY_SEARCH_FMT = "ytsearch:{}"
+_URL_SCHEMES = ("http://", "https://")
+_PLAYER_EXTRA = "player"
 _MAX_SEARCH_RESULTS = 8
 _MAX_POSITION_RESULTS = 6
 _DEFAULT_USER_PERMISSIONS = Permissions(
     connect=True,
     use_application_commands=True,
 )
+_GREEN = Color.green()
+_YELLOW = Color.yellow()
+_RED = Color.red()
+_PRETTY_PERMISSIONS = {
+    perm: f"_{perm.replace('_', ' ').replace('guild', 'server')}_"
+    for perm in Permissions.VALID_FLAGS
+}
+_get_pretty_permission = _PRETTY_PERMISSIONS.__getitem__
+_TRACKS_REQUEST_FAILED_EMBED = Embed(
+    title="Search didn't proceed as expected",
+    color=_GREEN,
+).set_footer(text="I wasn't able to contact my assistant")
+_TRACKS_LOAD_FAILED_EMBED = Embed(
+    title="I have no idea what you're looking for",
+    color=_GREEN,
+).set_footer(text="What kind of voodoo shi you trying to do on me?")
+_PLAYER_PAUSED_EMBED = Embed(title="Player has been paused", color=_GREEN)
+_PLAYER_ALREADY_PAUSED_EMBED = Embed(title="Player is already paused", color=_GREEN)
+_PLAYER_RESUMED_EMBED = Embed(title="Player has been resumed", color=_GREEN)
+_PLAYER_NOT_PAUSED_EMBED = Embed(title="Player is not paused", color=_GREEN)
+_EMPTY_QUEUE_PAGE_EMBED = Embed(title="Queue is empty", color=_GREEN)
+_NOTHING_TO_PLAY_EMBED = Embed(
+    title="Sorry, I couldn't find anything to play", color=_GREEN
+)
+_SAME_POSITION_MOVE_EMBED = Embed(
+    title="Why would you want to move the track to its current position?", color=_GREEN
+)
+_INVALID_SEEK_POSITION_EMBED = Embed(
+    title="You must provide a valid position", color=_GREEN
+)
+_QUEUE_CLEARED_EMBED = Embed(title="The queue is now empty", color=_GREEN)
+_NO_QUEUED_TRACKS_EMBED = Embed(title="There aren't queued tracks", color=_GREEN)
+_VOLUME_CHANGED_EMBED = Embed(title="Volume has been changed", color=_GREEN)
+_STAY_MODE_EMBED = Embed(title="Stay mode has been activated", color=_GREEN)
+_LEAVE_MODE_EMBED = Embed(title="Leave mode has been activated", color=_GREEN)
+_STAFF_ROLE_REMOVED_EMBED = Embed(title="Staff role has been removed", color=_GREEN)
+_NO_STAFF_COMMANDS_EMBED = Embed(
+    title="I was unable to find staff commands", color=_GREEN
+)
+_PLAYER_INFO_FIELDS = (
+    ("┃ Filter :level_slider:", True),
+    ("┃ Player Internal Volume :sound:", False),
+    ("┃ Shuffle Mode :twisted_rightwards_arrows:", True),
+    ("┃ Loop Mode :arrows_counterclockwise:", False),
+    ("┃ When Queue is Empty :zzz:", True),
+    ("┃ State :notes:", False),
+    ("┃ Staff Role :technologist:", True),
+)
 _PLAYER_BAR_SIZE = 20
 _QUEUE_PAGINATION_TIMEOUT = 40.0
 _QUEUE_PAGE_SIZE = 6
 _CURRENT_TRACK_MSG_TIMEOUT = 16.0
 _CURRENT_TRACK_MSG_EDIT_TIMEOUT = 1.0
-_ORDINAL_SUFFIX = (
-    "th",
-    "st",
-    "nd",
-    "rd",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-    "th",
-)
+_ORDINAL_SUFFIX = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
 _FILTER_PRESETS = {
     Filter.bassboost: lavalink.Equalizer(
         gains=[
@@ -173,15 +205,14 @@ def _cooldown() -> Callable[[app_commands.checks.T], app_commands.checks.T]:
 
 
 class _GuildNotWhitelisted(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 def _is_whitelisted() -> Callable[[app_commands.checks.T], app_commands.checks.T]:
     async def predicate(interaction: Interaction) -> bool:
         bot: "IceBeat" = interaction.client  # pyright: ignore[reportAssignmentType]
 
-        whitelist = await bot.store.get_whitelist()
-        if interaction.guild_id in whitelist.guild_ids:  # pyright: ignore[reportOptionalMemberAccess]
+        if await bot.store.is_whitelisted(interaction.guild_id):  # pyright: ignore[reportArgumentType]
             return True
         raise _GuildNotWhitelisted()
 
@@ -189,7 +220,7 @@ def _is_whitelisted() -> Callable[[app_commands.checks.T], app_commands.checks.T
 
 
 class _NotGuildOwner(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 def _is_guild_owner() -> Callable[[app_commands.checks.T], app_commands.checks.T]:
@@ -249,17 +280,12 @@ def _is_guild_owner_or_staff() -> Callable[
 
 
 class _QueueIsEmpty(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 def _is_queue_empty() -> Callable[[app_commands.checks.T], app_commands.checks.T]:
     async def predicate(interaction: Interaction) -> bool:
-        bot: "IceBeat" = interaction.client  # pyright: ignore[reportAssignmentType]
-        player: IceBeatPlayer = bot.lavalink_client.player_manager.create(  # pyright: ignore[reportCallIssue]
-            interaction.guild_id  # pyright: ignore[reportArgumentType]
-        )
-
-        if not player.queue:
+        if not _ready_player(interaction).queue:
             raise _QueueIsEmpty()
 
         return True
@@ -319,7 +345,7 @@ def _check_vc_perms_for_bot(channel: VoiceChannel, **required_perms: bool) -> No
 
 
 class _VoiceChannelIsFull(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 def _check_vc_user_limit(channel: VoiceChannel) -> None:
@@ -336,6 +362,10 @@ class _FailedToPreparePlayer(app_commands.CheckFailure):
         self.original_error = original_error
 
 
+def _ready_player(interaction: Interaction) -> IceBeatPlayer:
+    return interaction.extras[_PLAYER_EXTRA]
+
+
 def _parse_loop_mode(loop: bool) -> int:
     return IceBeatPlayer.LOOP_QUEUE if loop else IceBeatPlayer.LOOP_NONE
 
@@ -371,11 +401,11 @@ class _FailedToRetrievePlayer(app_commands.CheckFailure):
 
 
 class _MemberNotInVoiceChannel(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 class _BotNotInVoiceChannel(app_commands.CheckFailure):
-    pass
+    __slots__ = ()
 
 
 class _DifferentVoiceChannels(app_commands.CheckFailure):
@@ -385,84 +415,268 @@ class _DifferentVoiceChannels(app_commands.CheckFailure):
         self.voice_channel_id = voice_channel_id
 
 
+class _NotPlaying(app_commands.CheckFailure):
+    __slots__ = ()
+
+
 def _ensure_player_is_ready(
     bypass_channel_presence_check: bool = False,
+    requires_playing: bool = False,
 ) -> Callable[[app_commands.checks.T], app_commands.checks.T]:
     async def predicate(interaction: Interaction) -> bool:
         bot: "IceBeat" = interaction.client  # pyright: ignore[reportAssignmentType]
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
-        try:
-            player: IceBeatPlayer = bot.lavalink_client.player_manager.create(guild_id)
-        except Exception as e:
-            raise _FailedToRetrievePlayer(e)
+        player_manager = bot.lavalink_client.player_manager
+        if not (player := player_manager.get(guild_id)):
+            try:
+                player = player_manager.create(guild_id)
+            except Exception as e:
+                raise _FailedToRetrievePlayer(e)
+        interaction.extras[_PLAYER_EXTRA] = player
+
+        if requires_playing and not player.is_playing:
+            raise _NotPlaying()
 
         if bypass_channel_presence_check:
             return True
 
-        bot_voice_client = interaction.guild.voice_client  # pyright: ignore[reportOptionalMemberAccess]
+        guild: Guild = interaction.guild  # pyright: ignore[reportAssignmentType]
 
-        member: Member = interaction.user  # pyright: ignore[reportAssignmentType]
-        if not member.voice or not member.voice.channel:
+        # Same lookup as Member.voice, minus the property and method hops.
+        member_voice_state = guild._voice_states.get(interaction.user.id)
+        if not member_voice_state or not member_voice_state.channel:
             raise _MemberNotInVoiceChannel()
 
-        member_voice_channel: VoiceChannel = member.voice.channel  # pyright: ignore[reportAssignmentType]
-        if not bot_voice_client:
-            if interaction.command.name != Music.play.name:  # pyright: ignore[reportOptionalMemberAccess]
-                raise _BotNotInVoiceChannel()
+        member_voice_channel: VoiceChannel = member_voice_state.channel  # pyright: ignore[reportAssignmentType]
+        if bot_voice_client := guild.voice_client:
+            bot_voice_channel: VoiceChannel = bot_voice_client.channel  # pyright: ignore[reportAssignmentType]
+            if member_voice_channel.id != bot_voice_channel.id:
+                raise _DifferentVoiceChannels(bot_voice_channel.id)
 
-            _check_vc_perms_for_bot(member_voice_channel, connect=True, speak=True)
-            _check_vc_user_limit(member_voice_channel)
+            return True
 
-            await _prepare_player(bot, player, guild_id)
+        if interaction.command.name != Music.play.name:  # pyright: ignore[reportOptionalMemberAccess]
+            raise _BotNotInVoiceChannel()
 
-            await member_voice_channel.connect(cls=LavalinkVoiceClient, self_deaf=True)
+        _check_vc_perms_for_bot(member_voice_channel, connect=True, speak=True)
+        _check_vc_user_limit(member_voice_channel)
 
-            return True
+        # Player settings don't depend on the voice connection, so both are
+        # requested at once. A half-prepared player must not stay connected.
+        prepared, connected = await asyncio.gather(
+            _prepare_player(bot, player, guild_id),
+            member_voice_channel.connect(cls=LavalinkVoiceClient, self_deaf=True),
+            return_exceptions=True,
+        )
+        if isinstance(prepared, BaseException):
+            if voice_client := guild.voice_client:
+                await voice_client.disconnect(force=True)
 
-        bot_voice_channel: VoiceChannel = bot_voice_client.channel  # pyright: ignore[reportAssignmentType]
-        if member_voice_channel.id != bot_voice_channel.id:
-            raise _DifferentVoiceChannels(bot_voice_channel.id)
+            raise prepared
+        if isinstance(connected, BaseException):
+            raise connected
 
         return True
 
     return app_commands.check(predicate)
 
 
-class _NotPlaying(app_commands.CheckFailure):
-    pass
+def _prettify_missing_bot_permissions(error: app_commands.BotMissingPermissions) -> str:
+    perms = list(map(_get_pretty_permission, error.missing_permissions))
 
+    return (
+        perms[0]
+        if len(perms) == 1
+        else f"{'**,** '.join(perms[:-1])} **and** {perms[-1]}"
+    )
 
-def _is_playing() -> Callable[[app_commands.checks.T], app_commands.checks.T]:
-    def predicate(interaction: Interaction) -> bool:
-        bot: "IceBeat" = interaction.client  # pyright: ignore[reportAssignmentType]
-        guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
-        player: IceBeatPlayer = bot.lavalink_client.player_manager.create(guild_id)  # pyright: ignore[reportAssignmentType]
+_MEMBER_NOT_IN_VOICE_CHANNEL_DESCRIPTION = "Hop into <#%d>, I'm here"
+_DIFFERENT_VOICE_CHANNELS_DESCRIPTION = "Come to <#%d>"
 
-        if not player.is_playing:
-            raise _NotPlaying()
+_GUILD_NOT_WHITELISTED_EMBED = Embed(
+    title="This server isn't whitelisted",
+    color=_YELLOW,
+)
+_COMMAND_ON_COOLDOWN_EMBED = Embed(
+    title="Take it easy, do not spam commands",
+    color=_YELLOW,
+).set_footer(text="You still have tomorrow")
+_FAILED_TO_RETRIEVE_PLAYER_EMBED = Embed(
+    title="Music player failed to start",
+    color=_YELLOW,
+).set_footer(text="Sorry, but something went wrong...")
+_FAILED_TO_PREPARE_PLAYER_EMBED = Embed(
+    title="A problem occurred when preparing the player",
+    color=_YELLOW,
+).set_footer(text="Everything is fine, it wasn't your fault")
+_BOT_NOT_IN_VOICE_CHANNEL_EMBED = Embed(
+    title="I'm not in a voice channel",
+    color=_YELLOW,
+)
+_VOICE_CHANNEL_IS_FULL_EMBED = Embed(
+    title="Damn son, the channel's overflowing",
+    color=_YELLOW,
+).set_footer(text="I mean, it's full... duh")
+_NOT_PLAYING_EMBED = Embed(title="There's no track in the player", color=_YELLOW)
+_QUEUE_IS_EMPTY_EMBED = Embed(title="Queue is empty", color=_YELLOW)
+_MEMBER_NOT_IN_VOICE_CHANNEL_EMBED_TEMPLATE: dict[str, Any] = {
+    "title": "You must be in a voice channel",
+    "color": _YELLOW.value,
+}
+_MEMBER_NOT_IN_VOICE_CHANNEL_EMBED = Embed.from_dict(
+    _MEMBER_NOT_IN_VOICE_CHANNEL_EMBED_TEMPLATE
+)
+_DIFFERENT_VOICE_CHANNELS_EMBED_TEMPLATE: dict[str, Any] = {
+    "title": "You aren't in my voice channel",
+    "color": _YELLOW.value,
+}
+_UNEXPECTED_ERROR_EMBED = Embed(
+    title="Something bad has happened and I dunno why...",
+    color=_RED,
+)
 
-        return True
 
-    return app_commands.check(predicate)
+def _build_restricted_access_embed(
+    error: _NotGuildOwner | _NotGuildOwnerNorStaff, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    embed = Embed(
+        title="This command has restricted access",
+        description="**Allowed users:** server owner",
+        color=_YELLOW,
+    )
+    if type(error) is _NotGuildOwnerNorStaff and error.staff_role_id:
+        embed.description = (
+            f"{embed.description} and members of role <@&{error.staff_role_id}>"
+        )
+    return embed
 
 
-def _prettify_missing_bot_permissions(error: app_commands.BotMissingPermissions) -> str:
-    perms = [
-        f"_{perm.replace('_', ' ').replace('guild', 'server')}_"
-        for perm in error.missing_permissions
-    ]
-    nperms = len(perms)
+def _build_bot_missing_permissions_embed(
+    error: app_commands.BotMissingPermissions, interaction: Interaction
+) -> Embed:
+    _ = interaction
 
-    if nperms == 1:
-        fmted_perms = perms[0]
-    elif nperms == 2:
-        fmted_perms = f"{perms[0]} **and** {perms[1]}"
-    else:
-        fmted_perms = f"{'**,** '.join(perms[:-1])} **and** {perms[-1]}"
+    fmted_perms = _prettify_missing_bot_permissions(error)
+    return Embed(
+        title="Some permissions for me are missing",
+        description=f"**I can't** {fmted_perms}",
+        color=_YELLOW,
+    )
+
+
+def _build_bot_missing_permissions_in_voice_channel_embed(
+    error: _BotMissingPermissionsInVoiceChannel, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    fmted_perms = _prettify_missing_bot_permissions(error)
+    return Embed(
+        title="Some permissions for me are missing",
+        description=f"**I'm not allowed to** {fmted_perms} "
+        f"**in** <#{error.voice_channel_id}>",
+        color=_YELLOW,
+    )
+
+
+def _build_bot_role_missing_permissions_in_voice_channel_embed(
+    error: _BotRoleMissingPermissionsInVoiceChannel, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    fmted_perms = _prettify_missing_bot_permissions(error)
+    return Embed(
+        title="Some permissions for me are missing",
+        description=f"**Bot role <@&{error.role_id}> doesn't allow to** "
+        f"{fmted_perms} **in** <#{error.voice_channel_id}>",
+        color=_YELLOW,
+    )
+
+
+def _build_failed_to_retrieve_player_embed(
+    error: _FailedToRetrievePlayer, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    __log__.warning("Failed to retrieve server player: %s", error.original_error)
+
+    return _FAILED_TO_RETRIEVE_PLAYER_EMBED
+
+
+def _build_failed_to_prepare_player_embed(
+    error: _FailedToPreparePlayer, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    __log__.warning("Failed to prepare server player: %s", error.original_error)
+
+    return _FAILED_TO_PREPARE_PLAYER_EMBED
+
+
+def _build_member_not_in_voice_channel_embed(
+    error: _MemberNotInVoiceChannel, interaction: Interaction
+) -> Embed:
+    _ = error
+
+    if not (bot_voice_client := interaction.guild.voice_client):  # pyright: ignore[reportOptionalMemberAccess]
+        return _MEMBER_NOT_IN_VOICE_CHANNEL_EMBED
+
+    bot_voice_channel_id = bot_voice_client.channel.id
+    data = _MEMBER_NOT_IN_VOICE_CHANNEL_EMBED_TEMPLATE.copy()
+    data["description"] = (
+        _MEMBER_NOT_IN_VOICE_CHANNEL_DESCRIPTION % bot_voice_channel_id
+    )
+    return Embed.from_dict(data)
+
+
+def _build_different_voice_channels_embed(
+    error: _DifferentVoiceChannels, interaction: Interaction
+) -> Embed:
+    _ = interaction
+
+    data = _DIFFERENT_VOICE_CHANNELS_EMBED_TEMPLATE.copy()
+    data["description"] = _DIFFERENT_VOICE_CHANNELS_DESCRIPTION % error.voice_channel_id
+    return Embed.from_dict(data)
+
+
+_ERROR_EMBED_BUILDERS = ErrorEmbedBuilders[Interaction](
+    {
+        _GuildNotWhitelisted: static_error_embed(_GUILD_NOT_WHITELISTED_EMBED),
+        _NotGuildOwner: _build_restricted_access_embed,
+        _NotGuildOwnerNorStaff: _build_restricted_access_embed,
+        app_commands.BotMissingPermissions: _build_bot_missing_permissions_embed,
+        _BotMissingPermissionsInVoiceChannel: _build_bot_missing_permissions_in_voice_channel_embed,
+        _BotRoleMissingPermissionsInVoiceChannel: _build_bot_role_missing_permissions_in_voice_channel_embed,
+        app_commands.CommandOnCooldown: static_error_embed(_COMMAND_ON_COOLDOWN_EMBED),
+        _FailedToRetrievePlayer: _build_failed_to_retrieve_player_embed,
+        _FailedToPreparePlayer: _build_failed_to_prepare_player_embed,
+        _MemberNotInVoiceChannel: _build_member_not_in_voice_channel_embed,
+        _BotNotInVoiceChannel: static_error_embed(_BOT_NOT_IN_VOICE_CHANNEL_EMBED),
+        _DifferentVoiceChannels: _build_different_voice_channels_embed,
+        _VoiceChannelIsFull: static_error_embed(_VOICE_CHANNEL_IS_FULL_EMBED),
+        _NotPlaying: static_error_embed(_NOT_PLAYING_EMBED),
+        _QueueIsEmpty: static_error_embed(_QUEUE_IS_EMPTY_EMBED),
+    }
+)
+
+
+def _build_error_embed(error: Exception, interaction: Interaction) -> Embed | None:
+    if isinstance(error, (HTTPException, NotFound, errors.NotFound)):
+        return None
+
+    if builder := _ERROR_EMBED_BUILDERS.resolve(type(error)):
+        return builder(error, interaction)
+
+    __log__.warning(
+        "Error on %s command",
+        interaction.command.name,  # pyright: ignore[reportOptionalMemberAccess]
+        exc_info=True,
+    )
 
-    return fmted_perms
+    return _UNEXPECTED_ERROR_EMBED
 
 
 def _format_hyperlink(text: str, link: str) -> str:
@@ -477,19 +691,47 @@ def _format_hyperlink(text: str, link: str) -> str:
 
 
 def _milli_to_human_readable(duration: int) -> str:
-    total_secs = int(duration / 1_000)
-    total_mins = int(total_secs / 60)
-    remaining_secs = total_secs % 60
-    total_hours = int(total_mins / 60)
-    remaining_mins = total_mins % 60
-
-    formated = f":{'0' if remaining_secs < 10 else ''}{remaining_secs}"
-    if total_hours > 0:
-        formated = f"{total_hours}:{'0' if remaining_secs < 10 else ''}{remaining_mins}{formated}"
+    return _secs_to_human_readable(duration // 1_000)
+
+
+@lru_cache(maxsize=1024)
+def _secs_to_human_readable(duration: int) -> str:
+    total_mins, secs = divmod(duration, 60)
+    hours, mins = divmod(total_mins, 60)
+
+    if hours:
+        return f"{hours}:{mins:02d}:{secs:02d}"
+    return f"{mins}:{secs:02d}"
+
+
+def _is_ascii_number(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def _parse_seek_time(value: str) -> int | None:
+    # Accepts H:MM:SS (hours without leading zeros) and M:SS or MM:SS
+    # (minutes without leading zeros), with ASCII digits only.
+    parts = value.split(":")
+    if len(parts) == 3:
+        hours, mins, secs = parts
+        if not _is_ascii_number(hours) or hours[0] == "0":
+            return None
+        if len(mins) != 2 or not _is_ascii_number(mins):
+            return None
+    elif len(parts) == 2:
+        hours = "0"
+        mins, secs = parts
+        if not 0 < len(mins) <= 2 or not _is_ascii_number(mins):
+            return None
+        if len(mins) == 2 and mins[0] == "0":
+            return None
     else:
-        formated = f"{remaining_mins}{formated}"
+        return None
+
+    if len(secs) != 2 or not _is_ascii_number(secs):
+        return None
 
-    return formated
+    return ((int(hours) * 60 + int(mins)) * 60 + int(secs)) * 1_000
 
 
 class _SeekTimeTransformer(app_commands.Transformer):
@@ -498,30 +740,24 @@ class _SeekTimeTransformer(app_commands.Transformer):
     ) -> Optional[tuple[int, str]]:
         _ = interaction
 
-        match = _SEEK_TIME_RE.match(value)
-        if not match:
+        position = _parse_seek_time(value)
+        if position is None:
             return None
 
-        key_matches = match.groupdict()
+        return position, value
 
-        position = 0
-        if hours := key_matches.get("hours"):
-            position = (int(hours) * 3_600_000) + (int(key_matches["mins_h"]) * 60_000)
-        else:
-            position = int(key_matches["mins_m"]) * 60_000
-        position += int(key_matches["secs"]) * 1_000
 
-        return position, value
+def _plural(count: int) -> str:
+    return "s" if count > 1 else ""
 
 
 def _to_ordinal(value: int) -> str:
-    r = value % 100
-    suffix = _ORDINAL_SUFFIX[r] if r <= 13 else _ORDINAL_SUFFIX[value % 10]
+    suffix = "th" if 11 <= value % 100 <= 13 else _ORDINAL_SUFFIX[value % 10]
 
     return f"{value}{suffix}"
 
 
-@dataclass
+@dataclass(slots=True)
 class _CommandInfo:
     id: int
     qualified_name: str
@@ -554,7 +790,7 @@ class _QueuePage(Page):
         return Embed(
             title="Queue list is no longer available",
             description=f"Type **/{Music.queue.qualified_name}** to list queued tracks",
-            color=Color.green(),
+            color=_GREEN,
         )
 
     def _valid_player(self) -> bool:
@@ -565,13 +801,10 @@ class _QueuePage(Page):
             return self._unavailable_page_alert(), 1, 1, True
 
         if not (queue := self._player.queue):
-            embed = Embed(
-                title="Queue is empty",
-                color=Color.green(),
-            )
+            embed = _EMPTY_QUEUE_PAGE_EMBED
             return embed, 1, 1, True
 
-        embed = Embed(title="Queue", color=Color.green())
+        embed = Embed(title="Queue", color=_GREEN)
 
         if current := self._player.current:
             embed.add_field(
@@ -631,6 +864,7 @@ class _QueuePage(Page):
 class Music(commands.Cog):
     __slots__ = (
         "_bot",
+        "_bot_user_id",
         "_lavalink_client",
         "_staff_commands",
         "_cached_guild_staff_commands_info",
@@ -638,6 +872,7 @@ class Music(commands.Cog):
 
     def __init__(self, bot: "IceBeat") -> None:
         self._bot = bot
+        self._bot_user_id: int = bot.user.id  # pyright: ignore[reportOptionalMemberAccess]
         self._lavalink_client = self._setup_lavalink()
         self._staff_commands: list[
             tuple[app_commands.Command, Optional[app_commands.Group]]
@@ -650,7 +885,7 @@ class Music(commands.Cog):
         if queue_size := self._bot.conf.player.queue_size:
             Queue.set_max_size(queue_size)
 
-        lavalink_client = lavalink.Client(self._bot.user.id, player=IceBeatPlayer)  # pyright: ignore reportOptionalMemberAccess
+        lavalink_client = lavalink.Client(self._bot_user_id, player=IceBeatPlayer)
 
         lavalink_client.add_event_hooks(self)
 
@@ -732,10 +967,13 @@ class Music(commands.Cog):
 
         return False
 
+    def _get_guild_player(self, guild_id: int) -> IceBeatPlayer | None:
+        return self._bot.lavalink_client.player_manager.get(guild_id)  # pyright: ignore[reportReturnType]
+
     def _get_player(self, interaction: Interaction) -> Optional[IceBeatPlayer]:
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
-        return self._bot.lavalink_client.player_manager.get(guild_id)  # pyright: ignore[reportReturnType]
+        return self._get_guild_player(guild_id)
 
     async def _proceed_to_next_track(self, player: IceBeatPlayer) -> None:
         if not await self._guild_still_exists(player.guild_id):
@@ -775,7 +1013,7 @@ class Music(commands.Cog):
         embed = Embed(
             title="Sorry, I failed to play the track below",
             description=f"**{track_link}**",
-            color=Color.yellow(),
+            color=_YELLOW,
         )
         try:
             await followup.send(embed=embed, ephemeral=True)
@@ -854,13 +1092,15 @@ class Music(commands.Cog):
     async def on_voice_state_update(
         self, member: Member, before: VoiceState, after: VoiceState
     ) -> None:
-        player: Optional[IceBeatPlayer] = self._bot.lavalink_client.player_manager.get(
-            member.guild.id
-        )
-        if not player:
+        players = self._lavalink_client.player_manager.players
+        if not players:
             return
 
-        voice_client: Optional[LavalinkVoiceClient] = member.guild.voice_client  # pyright: ignore[reportAssignmentType]
+        guild = member.guild
+        if guild.id not in players:
+            return
+
+        voice_client: Optional[LavalinkVoiceClient] = guild.voice_client  # pyright: ignore[reportAssignmentType]
         if not voice_client:
             return
 
@@ -869,27 +1109,30 @@ class Music(commands.Cog):
             after.channel and after.channel.id == channel_id
         ):
             voice_states = voice_client.channel.voice_states
-            if len(voice_states) == 1 and self._bot.user.id in voice_states:  # pyright: ignore[reportOptionalMemberAccess]
+            if len(voice_states) == 1 and self._bot_user_id in voice_states:
                 await voice_client.disconnect()
 
+    # App command checks run bottom-up: the whitelist check sits closest to
+    # each command so other guilds never take cooldown tokens, and the store
+    # and voice work above the cooldown only runs when the cheap checks pass.
     @app_commands.command(description="Requests something to play")
     @app_commands.describe(
         query="Youtube/Spotify link or normal search as if you were on YouTube"
     )
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready()
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
+    @_is_whitelisted()
     async def play(self, interaction: Interaction, query: str) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         if player.queue.is_full():
-            embed = Embed(title="Queue is full", color=Color.green())
+            embed = Embed(title="Queue is full", color=_GREEN)
             embed.set_footer(
                 text=f"Queue only supports up to {player.queue.max_size} tracks"
             )
@@ -899,25 +1142,18 @@ class Music(commands.Cog):
         await interaction.response.defer(thinking=True)
 
         try:
-            search = query if _URL_RE.match(query) else _QUERY_SEARCH_FMT.format(query)
+            search = query if query.startswith(_URL_SCHEMES) else f"ytsearch:{query}"
             result = await player.node.get_tracks(search)
         except Exception as e:
-            __log__.warning("Failed to request tracks: %v", e)
+            __log__.warning("Failed to request tracks: %s", e)
 
-            embed = Embed(
-                title="Search didn't proceed as expected",
-                color=Color.green(),
-            )
-            embed.set_footer(text="I wasn't able to contact my assistant")
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=_TRACKS_REQUEST_FAILED_EMBED)
 
             return
 
         match result.load_type:
             case lavalink.LoadType.EMPTY:
-                embed = Embed(
-                    title="Sorry, I couldn't find anything to play", color=Color.green()
-                )
+                embed = _NOTHING_TO_PLAY_EMBED
                 await interaction.followup.send(embed=embed)
                 return
             case lavalink.LoadType.SEARCH | lavalink.LoadType.TRACK:
@@ -927,27 +1163,26 @@ class Music(commands.Cog):
             case lavalink.LoadType.ERROR:
                 error: lavalink.LoadResultError = result.error  # pyright: ignore[reportAssignmentType]
                 __log__.warning(
-                    "Lavalink retrieved an error when trying to search '%s': %s",
+                    "Lavalink retrieved an error when trying to search '%s': message=%s, cause=%s",
                     search,
                     error.message,
+                    error.cause,
                 )
 
-                embed = Embed(
-                    title="I have no idea what you're looking for",
-                    color=Color.green(),
-                )
-                embed.set_footer(text="What kind of voodoo shi you trying to do on me?")
-                await interaction.followup.send(embed=embed)
+                await interaction.followup.send(embed=_TRACKS_LOAD_FAILED_EMBED)
                 return
 
         free_queue_slots = player.queue.free_slots
 
         n_retrieved_tracks = len(tracks)
         n_enqueued_tracks = min(free_queue_slots, n_retrieved_tracks)
-        for i in range(n_enqueued_tracks):
-            track = tracks[i]
-            track.extra["followup"] = interaction.followup
-            player.add(track, requester=interaction.user.id)
+        enqueued_tracks = tracks[:n_enqueued_tracks]
+        followup = interaction.followup
+        requester = interaction.user.id
+        for track in enqueued_tracks:
+            track.extra["followup"] = followup
+            track.requester = requester
+        player.queue.extend(enqueued_tracks)
 
         if len(tracks) == 1 and result.load_type != lavalink.LoadType.PLAYLIST:
             track = tracks[0]
@@ -956,7 +1191,7 @@ class Music(commands.Cog):
             embed = Embed(
                 title="Track was enqueued",
                 description=f"**{track_link}** ┃ `{duration}`",
-                color=Color.green(),
+                color=_GREEN,
             )
         else:
             collection_type = "Playlist"
@@ -969,30 +1204,33 @@ class Music(commands.Cog):
                 collection_type = ptype.capitalize()
             collection_link = _format_hyperlink(result.playlist_info.name, query)
             embed = Embed(
-                title=f"{n_enqueued_tracks} track{'s' if free_queue_slots > 1 else ''} were enqueued",
+                title=f"{n_enqueued_tracks} track{_plural(free_queue_slots)} were enqueued",
                 description=f"**{collection_type}:** **{collection_link}**",
-                color=Color.green(),
+                color=_GREEN,
             )
             if n_enqueued_tracks < n_retrieved_tracks:
                 embed.set_footer(
                     text=f"It contains {n_retrieved_tracks} track"
-                    f"{'s' if n_retrieved_tracks > 1 else ''}, although the queue has\n"
+                    f"{_plural(n_retrieved_tracks)}, although the queue has\n"
                     f"reached its full capacity ({player.queue.max_size} track"
-                    f"{'s' if player.queue.max_size > 1 else ''})"
+                    f"{_plural(player.queue.max_size)})"
                 )
 
-        if not player.is_playing:
-            await player.play()
-
-        await interaction.followup.send(embed=embed)
+        if player.is_playing:
+            await interaction.followup.send(embed=embed)
+        else:
+            await asyncio.gather(
+                interaction.followup.send(embed=embed),
+                player.play(),
+            )
 
     @play.autocomplete("query")
-    @_is_whitelisted()
     @_bot_has_permissions(connect=True, speak=True)
+    @_is_whitelisted()
     async def query_autocomplete(
         self, interaction: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        if not current or _URL_RE.match(current):
+        if not current or current.startswith(_URL_SCHEMES):
             return []
 
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
@@ -1009,7 +1247,7 @@ class Music(commands.Cog):
 
             return []
 
-        query = _QUERY_SEARCH_FMT.format(current)
+        query = f"ytsearch:{current}"
         try:
             result = await player.node.get_tracks(query)
         except Exception as e:
@@ -1024,74 +1262,69 @@ class Music(commands.Cog):
         if result.load_type != lavalink.LoadType.SEARCH:
             return []
 
-        tracks = result.tracks
-        max_searches = min(len(tracks), _MAX_SEARCH_RESULTS)
         return [
-            app_commands.Choice(name=tracks[i].title, value=tracks[i].uri)
-            for i in range(max_searches)
+            app_commands.Choice(name=track.title, value=track.uri)
+            for track in result.tracks[:_MAX_SEARCH_RESULTS]
         ]
 
     @app_commands.command(description="Stops the player")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready(requires_playing=True)
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_playing()
+    @_is_whitelisted()
     async def pause(self, interaction: Interaction) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         if not player.paused:
             await player.set_pause(True)
 
-            embed = Embed(title="Player has been paused", color=Color.green())
+            embed = _PLAYER_PAUSED_EMBED
             ephemeral = False
         else:
-            embed = Embed(title="Player is already paused", color=Color.green())
+            embed = _PLAYER_ALREADY_PAUSED_EMBED
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
 
     @app_commands.command(description="Resumes the player")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready(requires_playing=True)
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_playing()
+    @_is_whitelisted()
     async def resume(self, interaction: Interaction) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         if player.paused:
             await player.set_pause(False)
 
-            embed = Embed(title="Player has been resumed", color=Color.green())
+            embed = _PLAYER_RESUMED_EMBED
             ephemeral = False
         else:
-            embed = Embed(title="Player is not paused", color=Color.green())
+            embed = _PLAYER_NOT_PAUSED_EMBED
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
 
     @app_commands.command(description="Skips current track")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready(requires_playing=True)
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_playing()
+    @_is_whitelisted()
     async def skip(self, interaction: Interaction) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         current_track: lavalink.AudioTrack = player.current  # pyright: ignore[reportAssignmentType]
 
@@ -1101,7 +1334,7 @@ class Music(commands.Cog):
         embed = Embed(
             title="Skipped current track",
             description=f"**I was playing {track_link}**",
-            color=Color.green(),
+            color=_GREEN,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -1110,20 +1343,20 @@ class Music(commands.Cog):
     @app_commands.rename(position="track")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_is_queue_empty()
+    @_ensure_player_is_ready()
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_queue_empty()
+    @_is_whitelisted()
     async def peek(
         self,
         interaction: Interaction,
         position: app_commands.Range[int, 1, None],
     ) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         queue_size = len(player.queue)
         ordinal_position = _to_ordinal(position)
         if position <= queue_size:
@@ -1133,14 +1366,14 @@ class Music(commands.Cog):
             embed = Embed(
                 title=f"{ordinal_position} track was dequeued to play now",
                 description=f"**[{next_track.title}]({next_track.uri})**",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = False
         else:
             embed = Embed(
-                title=f"Queue has {queue_size} track{'s' if queue_size > 1 else ''} "
+                title=f"Queue has {queue_size} track{_plural(queue_size)} "
                 f"so there isn't any track in the {ordinal_position} position",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
@@ -1153,42 +1386,39 @@ class Music(commands.Cog):
     @app_commands.rename(current_position="from", destination_position="to")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_is_queue_empty()
+    @_ensure_player_is_ready()
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_queue_empty()
+    @_is_whitelisted()
     async def move(
         self,
         interaction: Interaction,
         current_position: app_commands.Range[int, 1, None],
         destination_position: app_commands.Range[int, 1, None],
     ) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         ephemeral = True
         queue_size = len(player.queue)
         original_position = _to_ordinal(current_position)
         actual_position = _to_ordinal(destination_position)
         if current_position > queue_size:
             embed = Embed(
-                title=f"Queue has {queue_size} track{'s' if queue_size > 1 else ''} "
+                title=f"Queue has {queue_size} track{_plural(queue_size)} "
                 f"so there isn't any track in the {original_position} position",
-                color=Color.green(),
+                color=_GREEN,
             )
         elif destination_position > queue_size:
             embed = Embed(
-                title=f"Queue has {queue_size} track{'s' if queue_size > 1 else ''} "
+                title=f"Queue has {queue_size} track{_plural(queue_size)} "
                 f"and you wanted to move to the {destination_position} position",
-                color=Color.green(),
+                color=_GREEN,
             )
         elif current_position == destination_position:
-            embed = Embed(
-                title="Why would you want to move the track to its current position?",
-                color=Color.green(),
-            )
+            embed = _SAME_POSITION_MOVE_EMBED
         else:
             next_track = player.queue.move(
                 current_position - 1, destination_position - 1
@@ -1197,7 +1427,7 @@ class Music(commands.Cog):
             embed = Embed(
                 title=f"{original_position} track was moved to the {actual_position} position",
                 description=f"**[{next_track.title}]({next_track.uri})**",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = False
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
@@ -1207,20 +1437,20 @@ class Music(commands.Cog):
     @app_commands.rename(position="track")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_is_queue_empty()
+    @_ensure_player_is_ready()
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_queue_empty()
+    @_is_whitelisted()
     async def jump(
         self,
         interaction: Interaction,
         position: app_commands.Range[int, 1, None],
     ) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         queue_size = len(player.queue)
         ordinal_position = _to_ordinal(position)
         if position <= queue_size:
@@ -1233,14 +1463,14 @@ class Music(commands.Cog):
             embed = Embed(
                 title=f"Jumping to the {ordinal_position} track",
                 description=f"**[{next_track.title}]({next_track.uri})**",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = False
         else:
             embed = Embed(
-                title=f"Queue has {queue_size} track{'s' if queue_size > 1 else ''} "
+                title=f"Queue has {queue_size} track{_plural(queue_size)} "
                 f"and you tried to jump to the {ordinal_position} track",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
@@ -1250,37 +1480,36 @@ class Music(commands.Cog):
     @app_commands.rename(position="track")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_is_queue_empty()
+    @_ensure_player_is_ready()
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_queue_empty()
+    @_is_whitelisted()
     async def pop(
         self,
         interaction: Interaction,
         position: app_commands.Range[int, 1, None],
     ) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         queue_size = len(player.queue)
         ordinal_position = _to_ordinal(position)
         if position <= queue_size:
-            removed_track = player.queue[position - 1]
-            player.queue.pop(position - 1)
+            removed_track = player.queue.pop(position - 1)
 
             embed = Embed(
                 title=f"Successfully removed {ordinal_position} track from queue",
                 description=f"**[{removed_track.title}]({removed_track.uri})**",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = False
         else:
             embed = Embed(
-                title=f"Queue has {queue_size} track{'s' if queue_size > 1 else ''} "
+                title=f"Queue has {queue_size} track{_plural(queue_size)} "
                 f"and you tried to remove the {ordinal_position} track",
-                color=Color.green(),
+                color=_GREEN,
             )
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
@@ -1289,8 +1518,8 @@ class Music(commands.Cog):
     @move.autocomplete("current_position")
     @jump.autocomplete("position")
     @pop.autocomplete("position")
-    @_is_whitelisted()
     @_bot_has_permissions(connect=True, speak=True)
+    @_is_whitelisted()
     async def position_autocomplete(
         self, interaction: Interaction, current: str
     ) -> list[app_commands.Choice[int]]:
@@ -1331,14 +1560,13 @@ class Music(commands.Cog):
     )
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready(requires_playing=True)
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready()
-    @_is_playing()
+    @_is_whitelisted()
     async def seek(
         self,
         interaction: Interaction,
@@ -1348,11 +1576,9 @@ class Music(commands.Cog):
     ) -> None:
         ephemeral = True
         if not position:
-            embed = Embed(
-                title="You must provide a valid position", color=Color.green()
-            )
+            embed = _INVALID_SEEK_POSITION_EMBED
         else:
-            player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+            player = _ready_player(interaction)
 
             position_milli, position_original = position
 
@@ -1362,14 +1588,14 @@ class Music(commands.Cog):
                 embed = Embed(
                     title="Track's shorter than the position you provided",
                     description=f"**Track duration:** `{track_duration}`\n\n**[{current_track.title}]({current_track.uri})**",
-                    color=Color.green(),
+                    color=_GREEN,
                 )
             else:
                 await player.seek(position_milli)
 
                 embed = Embed(
                     title=f"Seeked to position `{position_original}`",
-                    color=Color.green(),
+                    color=_GREEN,
                 )
                 ephemeral = False
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
@@ -1377,35 +1603,38 @@ class Music(commands.Cog):
     @app_commands.command(description="Displays current track")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
+    @_ensure_player_is_ready(bypass_channel_presence_check=True, requires_playing=True)
+    @_cooldown()
     @_bot_has_permissions(
         connect=True,
         speak=True,
     )
-    @_cooldown()
-    @_ensure_player_is_ready(bypass_channel_presence_check=True)
-    @_is_playing()
+    @_is_whitelisted()
     async def current(self, interaction: Interaction) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         def build_message(player: IceBeatPlayer) -> Embed:
             voice_client: LavalinkVoiceClient = interaction.guild.voice_client  # pyright: ignore[reportOptionalMemberAccess, reportAssignmentType]
             current_track: lavalink.AudioTrack = player.current  # pyright: ignore[reportAssignmentType]
             position = player.position
             current_time = _milli_to_human_readable(position)
-            timeline = ["─"] * _PLAYER_BAR_SIZE
-            timeline[int((position * _PLAYER_BAR_SIZE) / current_track.duration)] = (
-                ":white_circle:"
+            elapsed = min(
+                position * _PLAYER_BAR_SIZE // current_track.duration,
+                _PLAYER_BAR_SIZE - 1,
             )
+            remaining = _PLAYER_BAR_SIZE - elapsed - 1
             max_time = _milli_to_human_readable(current_track.duration)
-            player_bar = f"`{current_time}` ┃{''.join(timeline)}┃ `{max_time}`"
+            player_bar = (
+                f"`{current_time}` ┃{'─' * elapsed}:white_circle:"
+                f"{'─' * remaining}┃ `{max_time}`"
+            )
             track_link = _format_hyperlink(current_track.title, current_track.uri)
             embed = Embed(
                 title=f"Playing at <#{voice_client.channel.id}>"
                 f"{' (paused)' if player.paused else ''}",
                 description=f"**{track_link}**\n\n"
                 f"{player_bar}\n\n**Enqueued by** <@{current_track.requester}>",
-                color=Color.green(),
+                color=_GREEN,
             )
             if player.queue:
                 queue_size = len(player.queue)
@@ -1454,9 +1683,9 @@ class Music(commands.Cog):
     @app_commands.command(description="Lists queued tracks")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
     @_ensure_player_is_ready(bypass_channel_presence_check=True)
+    @_cooldown()
+    @_is_whitelisted()
     async def queue(self, interaction: Interaction) -> None:
         pagination = InteractionPagination(
             _QUEUE_PAGINATION_TIMEOUT,
@@ -1468,85 +1697,79 @@ class Music(commands.Cog):
     @app_commands.command(description="Removes all queued tracks")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
     @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def clear(self, interaction: Interaction) -> None:
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
 
         if player.queue:
             player.queue.clear()
 
-            embed = Embed(
-                title="The queue is now empty",
-                color=Color.green(),
-            )
+            embed = _QUEUE_CLEARED_EMBED
             ephemeral = False
         else:
-            embed = Embed(
-                title="There aren't queued tracks",
-                color=Color.green(),
-            )
+            embed = _NO_QUEUED_TRACKS_EMBED
             ephemeral = True
         await interaction.response.send_message(embed=embed, ephemeral=ephemeral)
 
     @app_commands.command(description="Forces me to disconnect from the voice channel")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
     @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def leave(self, interaction: Interaction) -> None:
         voice_client: LavalinkVoiceClient = interaction.guild.voice_client  # pyright: ignore[reportOptionalMemberAccess, reportAssignmentType]
         await voice_client.disconnect(stop=True)
 
         embed = Embed(
             title=f"Disconnected from <#{voice_client.channel.id}>",
-            color=Color.green(),
+            color=_GREEN,
         )
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(description="Toggles queue's shuffle mode")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
+    @_ensure_player_is_ready()
     @_staff_only()
     @_is_guild_owner_or_staff()
-    @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def shuffle(self, interaction: Interaction) -> None:
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
         shuffle = await self._bot.store.switch_guild_shuffle(guild_id)
 
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         player.set_shuffle(shuffle)
 
         embed = Embed(
             title=f"Shuffle mode has been {'enabled' if shuffle else 'disabled'}",
-            color=Color.green(),
+            color=_GREEN,
         )
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(description="Toggles queue's loop mode")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
+    @_ensure_player_is_ready()
     @_staff_only()
     @_is_guild_owner_or_staff()
-    @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def loop(self, interaction: Interaction) -> None:
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
-        loop = await self._bot.store.switch_guild_shuffle(guild_id)
+        loop = await self._bot.store.switch_guild_loop(guild_id)
 
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         player.set_loop(_parse_loop_mode(loop))
 
         embed = Embed(
             title=f"Loop mode has been {'enabled' if loop else 'disabled'}",
-            color=Color.green(),
+            color=_GREEN,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -1554,11 +1777,11 @@ class Music(commands.Cog):
     @app_commands.describe(level="volume level (the higher, the worst)")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
+    @_ensure_player_is_ready()
     @_staff_only()
     @_is_guild_owner_or_staff()
-    @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def volume(
         self, interaction: Interaction, level: app_commands.Range[int, 0, 100]
     ) -> None:
@@ -1566,21 +1789,21 @@ class Music(commands.Cog):
 
         await self._bot.store.set_guild_volume(guild_id, volume=level)
 
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         await player.set_volume(vol=level)
 
-        embed = Embed(title="Volume has been changed", color=Color.green())
+        embed = _VOLUME_CHANGED_EMBED
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(description="Sets player filter")
     @app_commands.describe(filter="filter name")
     @app_commands.rename(filter="name")
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
+    @_ensure_player_is_ready()
     @_staff_only()
     @_is_guild_owner_or_staff()
-    @_ensure_player_is_ready()
+    @_cooldown()
+    @_is_whitelisted()
     async def filter(
         self,
         interaction: Interaction,
@@ -1590,12 +1813,10 @@ class Music(commands.Cog):
 
         await self._bot.store.set_guild_filter(guild_id, filter)
 
-        player: IceBeatPlayer = self._get_player(interaction)  # pyright: ignore[reportAssignmentType]
+        player = _ready_player(interaction)
         await _set_filter_preset(player, filter)
 
-        embed = Embed(
-            title=f"Filter has been changed to {filter.name}", color=Color.green()
-        )
+        embed = Embed(title=f"Filter has been changed to {filter.name}", color=_GREEN)
         await interaction.response.send_message(embed=embed)
 
     _presence_group = app_commands.Group(
@@ -1610,17 +1831,17 @@ class Music(commands.Cog):
         description="Bot won’t leave the voice channel when the queue's empty",
     )
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
     @_staff_only()
     @_is_guild_owner_or_staff()
+    @_cooldown()
+    @_is_whitelisted()
     async def presence_stay(self, interaction: Interaction) -> None:
         await self._bot.store.set_guild_auto_leave(
             interaction.guild_id,  # pyright: ignore[reportArgumentType]
             auto_leave=False,
         )
 
-        embed = Embed(title="Stay mode has been activated", color=Color.green())
+        embed = _STAY_MODE_EMBED
         await interaction.response.send_message(embed=embed)
 
     @_presence_group.command(
@@ -1628,21 +1849,20 @@ class Music(commands.Cog):
         description="Bot will leave the voice channel when the queue's empty",
     )
     @_default_user_permissions()
-    @_is_whitelisted()
-    @_cooldown()
     @_staff_only()
     @_is_guild_owner_or_staff()
+    @_cooldown()
+    @_is_whitelisted()
     async def presence_leave(self, interaction: Interaction) -> None:
-        await self._bot.store.set_guild_auto_leave(
-            interaction.guild_id,  # pyright: ignore[reportArgumentType]
-            auto_leave=True,
-        )
+        guild: Guild = interaction.guild  # pyright: ignore[reportAssignmentType]
+
+        await self._bot.store.set_guild_auto_leave(guild.id, auto_leave=True)
 
-        voice_client = interaction.guild.voice_client  # pyright: ignore[reportOptionalMemberAccess]
+        voice_client = guild.voice_client
         if voice_client:
             await voice_client.disconnect(force=True)
 
-        embed = Embed(title="Leave mode has been activated", color=Color.green())
+        embed = _LEAVE_MODE_EMBED
         await interaction.response.send_message(embed=embed)
 
     _staff_group = app_commands.Group(
@@ -1658,9 +1878,9 @@ class Music(commands.Cog):
     )
     @app_commands.describe(role="staff role")
     @_default_user_permissions()
-    @_is_whitelisted()
     @_cooldown()
     @_is_guild_owner()
+    @_is_whitelisted()
     async def staff_set(self, interaction: Interaction, role: Role) -> None:
         await self._bot.store.set_guild_staff_role_id(
             interaction.guild_id,  # pyright: ignore[reportArgumentType]
@@ -1670,7 +1890,7 @@ class Music(commands.Cog):
         embed = Embed(
             title="Staff has been changed",
             description=f"**Role:** <@&{role.id}>",
-            color=Color.green(),
+            color=_GREEN,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -1679,9 +1899,9 @@ class Music(commands.Cog):
         description="Removes staff role (only the server owner will be allowed to configure the player)",
     )
     @_default_user_permissions()
-    @_is_whitelisted()
     @_cooldown()
     @_is_guild_owner()
+    @_is_whitelisted()
     async def staff_unset(self, interaction: Interaction) -> None:
         guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
 
@@ -1691,7 +1911,7 @@ class Music(commands.Cog):
                 guild_id, guild_db.staff_role_id
             )
 
-        embed = Embed(title="Staff role has been removed", color=Color.green())
+        embed = _STAFF_ROLE_REMOVED_EMBED
         await interaction.response.send_message(embed=embed)
 
     @_staff_group.command(
@@ -1699,8 +1919,8 @@ class Music(commands.Cog):
         description="Lists staff commands",
     )
     @_default_user_permissions()
-    @_is_whitelisted()
     @_cooldown()
+    @_is_whitelisted()
     async def staff_commands(self, interaction: Interaction) -> None:
         if commands := self._get_cached_guild_staff_commands_info(interaction.guild):  # pyright: ignore[reportArgumentType]
             fmted_commands = "\n".join(
@@ -1710,178 +1930,85 @@ class Music(commands.Cog):
             embed = Embed(
                 title="Staff Commands",
                 description=fmted_commands,
-                color=Color.green(),
+                color=_GREEN,
             )
             embed.set_footer(text="Server owner can also use these commands")
         else:
-            embed = Embed(
-                title="I was unable to find staff commands",
-                color=Color.green(),
-            )
+            embed = _NO_STAFF_COMMANDS_EMBED
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(description="Displays player info")
     @app_commands.guild_only()
     @_default_user_permissions()
-    @_is_whitelisted()
     @_cooldown()
+    @_is_whitelisted()
     async def player(self, interaction: Interaction) -> None:
-        guild_id: int = interaction.guild_id  # pyright: ignore[reportAssignmentType]
+        guild: Guild = interaction.guild  # pyright: ignore[reportAssignmentType]
+        guild_id = guild.id
 
-        embed = Embed(
-            title="Player Info",
-            color=Color.green(),
-        )
         guild_db = await self._bot.store.get_guild(guild_id)  # pyright: ignore[reportArgumentType]
         shuffle_mode_state = "enabled" if guild_db.shuffle else "disabled"
         loop_mode_state = "enabled" if guild_db.loop else "disabled"
         bot_presence = "stay" if guild_db.auto_leave else "leave"
-        voice_client: Optional[LavalinkVoiceClient] = interaction.guild.voice_client  # pyright: ignore[reportOptionalMemberAccess, reportAssignmentType]
+        voice_client: Optional[LavalinkVoiceClient] = guild.voice_client  # pyright: ignore[reportAssignmentType]
         if voice_client:
-            player = self._get_player(interaction)
+            player = self._get_guild_player(guild_id)
             player_state = (
                 f"in <#{voice_client.channel.id}>{' (paused)' if player.paused else ''}"  # pyright: ignore[reportOptionalMemberAccess]
             )
         else:
             player_state = "not connected"
         staff_role = "not assigned"
+        stale_staff_role_id = None
         if guild_db.staff_role_id:
-            if interaction.guild.get_role(guild_db.staff_role_id):  # pyright: ignore[reportOptionalMemberAccess]
+            if guild.get_role(guild_db.staff_role_id):
                 staff_role = f"<@&{guild_db.staff_role_id}>"
             else:
-                await self._bot.store.unset_guild_staff_role_id_if_same(
-                    guild_id, guild_db.staff_role_id
-                )
-        embed.add_field(
-            name="┃ Filter :level_slider:",
-            value=f"- {guild_db.filter.name}",
+                stale_staff_role_id = guild_db.staff_role_id
+        values = (
+            guild_db.filter.name,
+            guild_db.volume,
+            shuffle_mode_state,
+            loop_mode_state,
+            bot_presence,
+            player_state,
+            staff_role,
         )
-        embed.add_field(
-            name="┃ Player Internal Volume :sound:",
-            value=f"- {guild_db.volume}",
-            inline=False,
-        )
-        embed.add_field(
-            name="┃ Shuffle Mode :twisted_rightwards_arrows:",
-            value=f"- {shuffle_mode_state}",
+        embed = Embed.from_dict(
+            {
+                "title": "Player Info",
+                "color": _GREEN.value,
+                "fields": [
+                    {"name": name, "value": f"- {value}", "inline": inline}
+                    for (name, inline), value in zip(_PLAYER_INFO_FIELDS, values)
+                ],
+            }
         )
-        embed.add_field(
-            name="┃ Loop Mode :arrows_counterclockwise:",
-            value=f"- {loop_mode_state}",
-            inline=False,
-        )
-        embed.add_field(
-            name="┃ When Queue is Empty :zzz:",
-            value=f"- {bot_presence}",
-        )
-        embed.add_field(name="┃ State :notes:", value=f"- {player_state}", inline=False)
-        embed.add_field(name="┃ Staff Role :technologist:", value=f"- {staff_role}")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        send = interaction.response.send_message(embed=embed, ephemeral=True)
+        if stale_staff_role_id:
+            # The reply doesn't depend on the cleanup, so they can overlap.
+            await asyncio.gather(
+                send,
+                self._bot.store.unset_guild_staff_role_id_if_same(
+                    guild_id, stale_staff_role_id
+                ),
+            )
+        else:
+            await send
 
     @override
     async def cog_app_command_error(
         self, interaction: Interaction, error: app_commands.AppCommandError
     ) -> None:
-        if isinstance(error, (HTTPException, NotFound, errors.NotFound)):
+        if not (embed := _build_error_embed(error, interaction)):
             return
-        elif isinstance(error, _GuildNotWhitelisted):
-            embed = Embed(
-                title="This server isn't whitelisted",
-                color=Color.yellow(),
-            )
-        elif isinstance(error, (_NotGuildOwner, _NotGuildOwnerNorStaff)):
-            embed = Embed(
-                title="This command has restricted access",
-                description="**Allowed users:** server owner",  # pyright: ignore[reportOptionalMemberAccess]
-                color=Color.yellow(),
-            )
-            if isinstance(error, _NotGuildOwnerNorStaff) and error.staff_role_id:
-                embed.description = (
-                    f"{embed.description} and members of role <@&{error.staff_role_id}>"
-                )
-        elif isinstance(error, app_commands.BotMissingPermissions):
-            embed = Embed(
-                title="Some permissions for me are missing",
-                color=Color.yellow(),
-            )
-            fmted_perms = _prettify_missing_bot_permissions(error)
-            if isinstance(error, _BotMissingPermissionsInVoiceChannel):
-                description = (
-                    f"**I'm not allowed to** {fmted_perms} "
-                    f"**in** <#{error.voice_channel_id}>"
-                )
-            elif isinstance(error, _BotRoleMissingPermissionsInVoiceChannel):
-                description = (
-                    f"**Bot role <@&{error.role_id}> doesn't allow to** "
-                    f"{fmted_perms} **in** <#{error.voice_channel_id}>"
-                )
-            else:
-                description = f"**I can't** {fmted_perms}"
-            embed.description = description
-        elif isinstance(error, app_commands.CommandOnCooldown):
-            embed = Embed(
-                title="Take it easy, do not spam commands",
-                color=Color.yellow(),
-            )
-            embed.set_footer(text="You still have tomorrow")
-        elif isinstance(error, _FailedToRetrievePlayer):
-            __log__.warning(
-                "Failed to retrieve server player: %v", error.original_error
-            )
-
-            embed = Embed(
-                title="Music player failed to start",
-                color=Color.yellow(),
-            )
-            embed.set_footer(text="Sorry, but something went wrong...")
-        elif isinstance(error, _FailedToPreparePlayer):
-            __log__.warning("Failed to prepare server player: %v", error.original_error)
 
-            embed = Embed(
-                title="A problem occurred when preparing the player",
-                color=Color.yellow(),
-            )
-            embed.set_footer(text="Everything is fine, it wasn't your fault")
-        elif isinstance(error, _MemberNotInVoiceChannel):
-            embed = Embed(
-                title="You must be in a voice channel",
-                color=Color.yellow(),
-            )
-            if bot_voice_client := interaction.guild.voice_client:  # pyright: ignore[reportOptionalMemberAccess]
-                bot_voice_channel: VoiceChannel = bot_voice_client.channel  # pyright: ignore[reportAssignmentType]
-                embed.description = f"Hop into <#{bot_voice_channel.id}>, I'm here"
-        elif isinstance(error, _BotNotInVoiceChannel):
-            embed = Embed(
-                title="I'm not in a voice channel",
-                color=Color.yellow(),
-            )
-        elif isinstance(error, _DifferentVoiceChannels):
-            embed = Embed(
-                title="You aren't in my voice channel",
-                color=Color.yellow(),
-            )
-            embed.description = f"Come to <#{error.voice_channel_id}>"
-        elif isinstance(error, _VoiceChannelIsFull):
-            embed = Embed(
-                title="Damn son, the channel's overflowing",
-                color=Color.yellow(),
-            )
-            embed.set_footer(text="I mean, it's full... duh")
-        elif isinstance(error, _NotPlaying):
-            embed = Embed(title="There's no track in the player", color=Color.yellow())
-        elif isinstance(error, _QueueIsEmpty):
-            embed = Embed(title="Queue is empty", color=Color.yellow())
-        else:
-            __log__.warning(
-                f"Error on {interaction.command.name} command",  # pyright: ignore[reportOptionalMemberAccess]
-                exc_info=True,
-            )
-
-            embed = Embed(
-                title="Something bad has happened and I dunno why...",
-                color=Color.red(),
-            )
+        send = (
+            interaction.followup.send
+            if interaction.response.is_done()
+            else interaction.response.send_message
+        )
         try:
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await send(embed=embed, ephemeral=True)
         except HTTPException:
             pass
@@ -6,6 +6,8 @@ from discord.ext import commands
 
 from icebeat.voice import LavalinkVoiceClient
 
+from .errors import ErrorEmbedBuilders, static_error_embed
+from ..model import Whitelist
 from ..ui import ContextPagination, Page, compute_total_pages
 
 
@@ -16,8 +18,34 @@ __all__ = ["Owner"]
 
 __log__ = logging.getLogger(__name__)
 
+_GREEN = Color.green()
+_YELLOW = Color.yellow()
+_RED = Color.red()
 _WHITELIST_PAGINATION_TIMEOUT = 15.0
 _WHITELIST_PAGE_SIZE = 6
+_NO_WHITELISTED_SERVERS_EMBED = Embed(
+    title="There aren't whitelisted servers", color=_GREEN
+)
+_EMPTY_WHITELIST_EMBED = Embed(title="Whitelist is empty", color=_YELLOW)
+_ALL_SERVERS_SYNCED_EMBED = Embed(
+    title="Commands synced with success on all servers", color=_GREEN
+)
+_INVALID_SERVER_EMBED = Embed(
+    title="Invalid server name/ID or bot isn't a member of it",
+    color=_YELLOW,
+)
+_COMMAND_ON_COOLDOWN_EMBED = Embed(
+    title="You need to take it easy, slow down",
+    color=_YELLOW,
+)
+_MISSING_SERVER_EMBED = Embed(
+    title="You must provide a server name or ID",
+    color=_YELLOW,
+).set_footer(text="I may not differentiate servers only by its name")
+_UNEXPECTED_ERROR_EMBED = Embed(
+    title="Something unexpected went wrong...",
+    color=_RED,
+)
 
 
 def _cooldown() -> Callable[[commands.core.T], commands.core.T]:
@@ -39,50 +67,98 @@ class _SubcommandNotFound(commands.CommandError):
     pass
 
 
+def _build_subcommand_not_found_embed(
+    error: _SubcommandNotFound, ctx: commands.Context
+) -> Embed:
+    _ = error
+
+    return Embed(
+        title=f'No subcommand named "{ctx.subcommand_passed}"',
+        color=_YELLOW,
+    )
+
+
+_IGNORED_ERROR = static_error_embed(None)
+
+_ERROR_EMBED_BUILDERS = ErrorEmbedBuilders[commands.Context](
+    {
+        commands.BadArgument: static_error_embed(_INVALID_SERVER_EMBED),
+        commands.CommandOnCooldown: static_error_embed(_COMMAND_ON_COOLDOWN_EMBED),
+        commands.MissingRequiredArgument: static_error_embed(_MISSING_SERVER_EMBED),
+        commands.PrivateMessageOnly: _IGNORED_ERROR,
+        commands.NotOwner: _IGNORED_ERROR,
+        _SubcommandNotFound: _build_subcommand_not_found_embed,
+    }
+)
+
+
+def _build_error_embed(error: Exception, ctx: commands.Context) -> Embed | None:
+    if builder := _ERROR_EMBED_BUILDERS.resolve(type(error)):
+        return builder(error, ctx)
+
+    __log__.warning(
+        "Error on %s command",
+        ctx.command.qualified_name,  # pyright: ignore[reportOptionalMemberAccess]
+        exc_info=True,
+    )
+
+    return _UNEXPECTED_ERROR_EMBED
+
+
 class _WhitelistPage(Page):
-    __slots__ = ("_bot", "_whitelist_waiter")
+    __slots__ = ("_bot", "_sorted_guild_ids", "_whitelist", "_whitelist_waiter")
 
     def __init__(self, bot: "IceBeat") -> None:
         self._bot = bot
         self._whitelist_waiter = bot.store.whitelist_waiter()
+        self._whitelist: Whitelist | None = None
+        self._sorted_guild_ids: list[int] = []
 
     async def fetch(self, current_page: int) -> tuple[Embed, int, int, bool]:
+        # Pages are cut from a sorted copy of the snapshot, so entries keep
+        # their place as the owner pages back and forth.
         whitelist = await self._bot.store.get_whitelist()
-        if not whitelist.guild_ids:
-            embed = Embed(
-                title="There aren't whitelisted servers",
-                color=Color.green(),
-            )
-            return embed, 1, 1, True
-        total_pages = compute_total_pages(
-            len(whitelist.guild_ids), _WHITELIST_PAGE_SIZE
-        )
-        if current_page > total_pages:
-            current_page = total_pages
-        offset = (current_page - 1) * _WHITELIST_PAGE_SIZE
-        guilds = []
-        for guild_id in list(whitelist.guild_ids)[
-            offset : offset + _WHITELIST_PAGE_SIZE
-        ]:
-            if guild := self._bot.get_guild(guild_id):
-                guilds.append(guild)
-                continue
-
-            await self._bot.store.remove_from_whitelist(guild_id)
-
-            __log__.info(
-                "Removed server %s from whitelist as bot is no longer a member",
-                guild_id,
-            )
+        if whitelist is not self._whitelist:
+            self._whitelist = whitelist
+            self._sorted_guild_ids = sorted(whitelist.guild_ids)
+        guild_ids = self._sorted_guild_ids
+        while True:
+            if not (n_guild_ids := len(guild_ids)):
+                embed = _NO_WHITELISTED_SERVERS_EMBED
+                return embed, 1, 1, True
+            total_pages = compute_total_pages(n_guild_ids, _WHITELIST_PAGE_SIZE)
+            if current_page > total_pages:
+                current_page = total_pages
+            offset = (current_page - 1) * _WHITELIST_PAGE_SIZE
+            guild_lines = []
+            missing_guild_ids = []
+            for guild_id in guild_ids[offset : offset + _WHITELIST_PAGE_SIZE]:
+                if guild := self._bot.get_guild(guild_id):
+                    guild_lines.append(f'- **"{guild.name}"** (**{guild.id}**)')
+                else:
+                    missing_guild_ids.append(guild_id)
+
+            if not missing_guild_ids:
+                break
+
+            await self._bot.store.remove_many_from_whitelist(missing_guild_ids)
+
+            for guild_id in missing_guild_ids:
+                __log__.info(
+                    "Removed server %s from whitelist as bot is no longer a member",
+                    guild_id,
+                )
 
-            return await self.fetch(current_page)
+            # The page is rebuilt from the local snapshot, without going
+            # back to the store.
+            guild_ids = [
+                guild_id for guild_id in guild_ids if guild_id not in missing_guild_ids
+            ]
 
         embed = Embed(
             title="Whitelisted Servers",
-            description="\n".join(
-                f'- **"{guild.name}"** (**{guild.id}**)' for guild in guilds
-            ),
-            color=Color.green(),
+            description="\n".join(guild_lines),
+            color=_GREEN,
         )
         embed.set_footer(text=f"page {current_page}/{total_pages}")
         return embed, current_page, total_pages, False
@@ -91,7 +167,7 @@ class _WhitelistPage(Page):
         return Embed(
             title="Whitelist no longer available",
             description=f"Type **/{Owner.whitelist_show.qualified_name}** to list whitelisted servers",
-            color=Color.green(),
+            color=_GREEN,
         )
 
     async def wait_for_edit_request(self) -> None:
@@ -107,10 +183,12 @@ class Owner(commands.Cog):
     def __init__(self, bot: "IceBeat") -> None:
         self._bot = bot
 
+    # Prefix command checks run top-down and the cooldown is only taken once
+    # they all pass, so non-owners never consume it.
     @commands.group()
-    @_cooldown()
     @commands.is_owner()
     @commands.dm_only()
+    @_cooldown()
     async def whitelist(self, ctx: commands.Context) -> None:
         if ctx.invoked_subcommand:
             return
@@ -121,7 +199,7 @@ class Owner(commands.Cog):
         embed = Embed(
             title="Available Subcommands",
             description=f"**Usage:** {ctx.prefix if ctx.prefix else ''}{self.whitelist.name} <subcommand> <arguments>",
-            color=Color.green(),
+            color=_GREEN,
         )
         for subcommand in self.whitelist.all_commands.values():
             parameters = " ".join(
@@ -163,12 +241,12 @@ class Owner(commands.Cog):
 
             embed = Embed(
                 title=f'Server "{server.name}" was inserted into the whitelist',
-                color=Color.green(),
+                color=_GREEN,
             )
         else:
             embed = Embed(
                 title=f'Server "{server.name}" is already whitelisted',
-                color=Color.yellow(),
+                color=_YELLOW,
             )
         embed.set_footer(text=f"Server ID: {server.id}")
         await ctx.reply(embed=embed)
@@ -190,11 +268,11 @@ class Owner(commands.Cog):
 
             embed = Embed(
                 title=f'Server "{server.name}" was removed from the whitelist',
-                color=Color.green(),
+                color=_GREEN,
             )
         else:
             embed = Embed(
-                title=f'Server "{server.name}" isn\'t whitelisted', color=Color.yellow()
+                title=f'Server "{server.name}" isn\'t whitelisted', color=_YELLOW
             )
         embed.set_footer(text=f"Server ID: {server.id}")
         await ctx.reply(embed=embed)
@@ -226,27 +304,21 @@ class Owner(commands.Cog):
                             guild_id,
                         )
 
-                embed = Embed(
-                    title="Commands synced with success on all servers",
-                    color=Color.green(),
-                )
+                embed = _ALL_SERVERS_SYNCED_EMBED
             else:
-                embed = Embed(
-                    title="Whitelist is empty",
-                    color=Color.yellow(),
-                )
+                embed = _EMPTY_WHITELIST_EMBED
         else:
             if server.id in whitelist.guild_ids:
                 await self._bot.add_app_commands_to_guild(server)
 
                 embed = Embed(
                     title=f'Commands synced with success on server "{server.name}"',
-                    color=Color.green(),
+                    color=_GREEN,
                 )
             else:
                 embed = Embed(
                     title=f'Server "{server.name}" isn\'t whitelisted',
-                    color=Color.yellow(),
+                    color=_YELLOW,
                 )
             embed.set_footer(text=f"Server ID: {server.id}")
         await ctx.reply(embed=embed)
@@ -261,37 +333,5 @@ class Owner(commands.Cog):
         ctx: commands.Context,
         error: Exception,
     ) -> None:
-        if isinstance(error, commands.BadArgument):
-            embed = Embed(
-                title="Invalid server name/ID or bot isn't a member of it",
-                color=Color.yellow(),
-            )
-        elif isinstance(error, commands.CommandOnCooldown):
-            embed = Embed(
-                title="You need to take it easy, slow down",
-                color=Color.yellow(),
-            )
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = Embed(
-                title="You must provide a server name or ID",
-                color=Color.yellow(),
-            )
-            embed.set_footer(text="I may not differentiate servers only by its name")
-        elif isinstance(error, (commands.PrivateMessageOnly, commands.NotOwner)):
-            return
-        elif isinstance(error, _SubcommandNotFound):
-            embed = Embed(
-                title=f'No subcommand named "{ctx.subcommand_passed}"',
-                color=Color.yellow(),
-            )
-        else:
-            __log__.warning(
-                f"Error on {ctx.command.qualified_name} command",  # pyright: ignore[reportOptionalMemberAccess]
-                exc_info=True,
-            )
-
-            embed = Embed(
-                title="Something unexpected went wrong...",
-                color=Color.red(),
-            )
-        await ctx.reply(embed=embed)
+        if embed := _build_error_embed(error, ctx):
+            await ctx.reply(embed=embed)
@@ -1,6 +1,7 @@
 from abc import ABC
 from dataclasses import dataclass, fields
 from configparser import ConfigParser, SectionProxy
+from functools import cache
 from pathlib import Path
 from typing import Optional, get_args
 
@@ -20,6 +21,11 @@ class ConfigError(Exception):
     pass
 
 
+class UnreadableFile(ConfigError):
+    def __init__(self, path: Path) -> None:
+        super().__init__(f"unable to read config file {path}")
+
+
 class MissingSection(ConfigError):
     def __init__(self, section: str) -> None:
         super().__init__(f"missing config section {section}")
@@ -96,25 +102,36 @@ class Config:
 def _read(path: Path) -> ConfigParser:
     raw = ConfigParser()
 
-    with open(path, "r") as f:
-        raw.read_file(f)
+    if not raw.read(path):
+        raise UnreadableFile(path)
 
     return raw
 
 
+@cache
+def _section_fields(section: type[_Section]) -> tuple[tuple[str, type, bool], ...]:
+    return tuple(
+        (
+            field.name,
+            types[0] if (types := get_args(field.type)) else field.type,  # pyright: ignore reportAssignmentType
+            field.default is None,
+        )
+        for field in fields(section)
+    )
+
+
 def _extract_section(section_proxy: SectionProxy, section: type[_Section]) -> _Section:
     kwargs = {}
 
-    for field in fields(section):
-        if field.name not in section_proxy:
-            if field.default is None:
+    for name, ftype, optional in _section_fields(section):
+        if name not in section_proxy:
+            if optional:
                 continue
-            raise MissingField(section_proxy.name, field.name)
+            raise MissingField(section_proxy.name, name)
         try:
-            ftype = types[0] if (types := get_args(field.type)) else field.type
-            kwargs[field.name] = ftype(section_proxy[field.name])  # pyright: ignore reportCallIssue
+            kwargs[name] = ftype(section_proxy[name])  # pyright: ignore reportCallIssue
         except ValueError:
-            raise InvalidField(section_proxy.name, field.name)
+            raise InvalidField(section_proxy.name, name)
 
     return section(**kwargs)
 
@@ -8,23 +8,19 @@ __all__ = ["setup_logger"]
 _PKG_NAME = __name__.split(".")[0]
 
 
-class _LogFilter(logging.Filter):
-    __slots__ = ("_verbose",)
-
-    def __init__(self, verbose: bool) -> None:
-        super().__init__()
-
-        self._verbose = verbose
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        return self._verbose or record.name.startswith(_PKG_NAME)
-
-
 def setup_logger(verbose: bool, debug: bool) -> None:
     level = logging.DEBUG if debug else logging.INFO
 
+    # None of these record attributes show up in the format below, so
+    # skip looking them up for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     handler = colorlog.StreamHandler()
-    handler.addFilter(_LogFilter(verbose))
+    if not verbose:
+        handler.addFilter(logging.Filter(_PKG_NAME))
     handler.setFormatter(
         colorlog.ColoredFormatter(
             "[%(asctime)s] [%(name)s] [%(log_color)s%(levelname)s%(reset)s] %(message)s"
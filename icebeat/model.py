@@ -17,7 +17,7 @@ class Filter(Enum):
     nightcore = 8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Guild:
     id: int
     staff_role_id: Optional[int]
@@ -28,6 +28,6 @@ class Guild:
     loop: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Whitelist:
-    guild_ids: set[int]
+    guild_ids: frozenset[int]
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any, Optional, SupportsIndex
 from functools import wraps
 
@@ -95,6 +96,17 @@ class Queue(list[lavalink.AudioTrack]):
 
         self.titles.append(track.title)
 
+    @override
+    @_post_processing_queue_change
+    def extend(self, tracks: Iterable[lavalink.AudioTrack], /) -> None:
+        tracks = list(tracks)
+        if len(tracks) > self._free_slots:
+            raise QueueIsFull()
+
+        super().extend(tracks)
+
+        self.titles.extend(track.title for track in tracks)
+
     @override
     @_post_processing_queue_change
     def pop(self, index: SupportsIndex = -1, /) -> lavalink.AudioTrack:
@@ -123,9 +135,9 @@ class Queue(list[lavalink.AudioTrack]):
 
     @_post_processing_queue_change
     def shrink(self, start: int) -> None:
-        self[:] = self[start:]
+        del self[:start]
 
-        self.titles = self.titles[start:]
+        del self.titles[:start]
 
     @_post_processing_queue_change
     def move(
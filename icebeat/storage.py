@@ -1,6 +1,15 @@
-from collections.abc import Coroutine
+import asyncio
+import sqlite3
+from collections.abc import (
+    AsyncGenerator,
+    Collection,
+    Coroutine,
+    Iterable,
+    Sequence,
+)
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Iterable, Optional
+from operator import itemgetter
+from typing import Any, Optional
 
 from aiosqlite.context import contextmanager
 from aiosqlite import Connection, Cursor, Row
@@ -11,12 +20,81 @@ from .store import Storage
 
 __all__ = ["SQLiteStorage"]
 
+_COMMIT_DELAY = 0.005
+
+# The storage keeps a single connection for the whole process, so these
+# settings (and its page cache) stick around for every query.
+_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+"""
+
+
+def _execute_and_close(
+    connection: sqlite3.Connection, sql: str, parameters: Iterable[Any]
+) -> None:
+    connection.execute(sql, parameters).close()
+
 
 class _ExtendedConnection:
-    __slots__ = ("_connection",)
+    __slots__ = (
+        "_active_writes",
+        "_committing",
+        "_connection",
+        "_pending_commit",
+        "_writes_done",
+    )
 
     def __init__(self, connection: Connection) -> None:
         self._connection = connection
+        self._pending_commit: asyncio.Task[None] | None = None
+        self._committing: asyncio.Task[None] | None = None
+        self._active_writes = 0
+        self._writes_done = asyncio.Event()
+
+    async def _delayed_commit(self) -> None:
+        await asyncio.sleep(_COMMIT_DELAY)
+
+        # Writes still running belong to this transaction, so wait for them.
+        while self._active_writes:
+            self._writes_done.clear()
+            await self._writes_done.wait()
+
+        self._committing, self._pending_commit = self._pending_commit, None
+        try:
+            await self._connection.commit()
+        except Exception:
+            # Otherwise the grouped statements would linger in the implicit
+            # transaction and be persisted by the next successful commit.
+            await self._connection.rollback()
+            raise
+        finally:
+            self._committing = None
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncGenerator[asyncio.Task[None], None]:
+        # Statements run right away, but the writes issued within the same
+        # short window wait on a single shared commit. New writes hold off
+        # while a commit (or its rollback) is in flight, as their statements
+        # would otherwise land in the transaction being closed.
+        while committing := self._committing:
+            await asyncio.wait((committing,))
+
+        if not (pending_commit := self._pending_commit):
+            pending_commit = self._pending_commit = asyncio.ensure_future(
+                self._delayed_commit()
+            )
+
+        self._active_writes += 1
+        try:
+            yield pending_commit
+        finally:
+            self._active_writes -= 1
+            if not self._active_writes:
+                self._writes_done.set()
 
     @contextmanager
     def execute(
@@ -30,23 +108,141 @@ class _ExtendedConnection:
         sql: str,
         parameters: Optional[Iterable[Any]] = None,
     ) -> AsyncGenerator[Cursor, None]:
-        async with self._connection.execute(sql, parameters) as cursor:
+        async with (
+            self._write() as pending_commit,
+            self._connection.execute(sql, parameters) as cursor,
+        ):
             yield cursor
 
-        await self._connection.commit()
+        await asyncio.shield(pending_commit)
 
     async def execute_auto_closable(
         self, sql: str, parameters: Optional[Iterable[Any]] = None
     ) -> None:
-        async with self._connection.execute(sql, parameters):
+        # Runs and closes the cursor in a single hop to the connection
+        # thread, skipping the cursor wrapper and its context manager.
+        await self._connection._execute(  # pyright: ignore
+            _execute_and_close,
+            self._connection._conn,  # pyright: ignore
+            sql,
+            parameters or (),
+        )
+
+    async def execute_script(self, sql_script: str) -> None:
+        async with self._connection.executescript(sql_script):
             pass
 
     async def execute_auto_closable_commited(
         self, sql: str, parameters: Optional[Iterable[Any]] = None
     ) -> None:
-        await self.execute_auto_closable(sql, parameters)
-
-        await self._connection.commit()
+        async with self._write() as pending_commit:
+            await self.execute_auto_closable(sql, parameters)
+
+        await asyncio.shield(pending_commit)
+
+
+_FILTERS_BY_VALUE = {filter.value: filter for filter in Filter}
+
+
+def _build_guild(guild_id: int, row: Sequence[Any]) -> Guild:
+    return Guild(
+        id=guild_id,
+        staff_role_id=row[0],
+        filter=_FILTERS_BY_VALUE[row[1]],
+        volume=row[2],
+        auto_leave=bool(row[3]),
+        shuffle=bool(row[4]),
+        loop=bool(row[5]),
+    )
+
+
+_GET_GUILD_SQL = """
+    SELECT staff_role_id, filter, volume, auto_leave, shuffle, loop
+    FROM guilds
+    WHERE id = ?
+"""
+
+# The no-op update makes RETURNING yield the row even when it already exists.
+_CREATE_GUILD_SQL = """
+    INSERT INTO guilds (id)
+    VALUES (?)
+    ON CONFLICT (id)
+    DO UPDATE SET id = id
+    RETURNING staff_role_id, filter, volume, auto_leave, shuffle, loop
+"""
+
+_SET_GUILD_STAFF_ROLE_ID_SQL = """
+    INSERT INTO guilds (id, staff_role_id)
+    VALUES (?, ?)
+    ON CONFLICT (id)
+    DO UPDATE SET staff_role_id = excluded.staff_role_id
+"""
+
+_UNSET_GUILD_STAFF_ROLE_ID_IF_SAME_SQL = """
+    INSERT INTO guilds (id)
+    VALUES (?1)
+    ON CONFLICT (id)
+    DO UPDATE SET staff_role_id =
+        CASE WHEN staff_role_id = ?2
+            THEN NULL
+            ELSE staff_role_id
+        END
+"""
+
+_SET_GUILD_FILTER_SQL = """
+    INSERT INTO guilds (id, filter)
+    VALUES (?, ?)
+    ON CONFLICT (id)
+    DO UPDATE SET filter = excluded.filter
+"""
+
+_SET_GUILD_VOLUME_SQL = """
+    INSERT INTO guilds (id, volume)
+    VALUES (?, ?)
+    ON CONFLICT (id)
+    DO UPDATE SET volume = excluded.volume
+"""
+
+_SET_GUILD_AUTO_LEAVE_SQL = """
+    INSERT INTO guilds (id, auto_leave)
+    VALUES (?, ?)
+    ON CONFLICT (id)
+    DO UPDATE SET auto_leave = excluded.auto_leave
+"""
+
+_SWITCH_GUILD_SHUFFLE_SQL = """
+    INSERT INTO guilds (id)
+    VALUES (?)
+    ON CONFLICT (id)
+    DO UPDATE SET shuffle = NOT shuffle
+    RETURNING shuffle
+"""
+
+_SWITCH_GUILD_LOOP_SQL = """
+    INSERT INTO guilds (id)
+    VALUES (?)
+    ON CONFLICT (id)
+    DO UPDATE SET loop = NOT loop
+    RETURNING loop
+"""
+
+_GET_WHITELIST_SQL = """
+    SELECT guild_id FROM whitelist
+"""
+
+_ADD_TO_WHITELIST_SQL = """
+    INSERT INTO whitelist (guild_id)
+    VALUES (?)
+    ON CONFLICT (guild_id)
+    DO NOTHING
+    RETURNING TRUE
+"""
+
+_REMOVE_FROM_WHITELIST_SQL = """
+    DELETE FROM whitelist
+    WHERE guild_id = ?
+    RETURNING TRUE
+"""
 
 
 class SQLiteStorage(Storage):
@@ -56,168 +252,111 @@ class SQLiteStorage(Storage):
         self._connection = _ExtendedConnection(connection)
 
     async def prepare(self) -> None:
-        await self._connection.execute_auto_closable("PRAGMA foreign_keys = ON")
+        await self._connection.execute_script(_PRAGMAS)
 
     async def get_guild(self, guild_id: int) -> Guild:
+        async with self._connection.execute(_GET_GUILD_SQL, (guild_id,)) as cursor:
+            row: Row = await cursor.fetchone()  # pyright: ignore
+
+        return _build_guild(guild_id, row)
+
+    async def get_guilds(self, guild_ids: Collection[int]) -> list[Guild]:
+        if not guild_ids:
+            return []
+
         async with self._connection.execute(
-            """
-            SELECT staff_role_id, filter, volume, auto_leave, shuffle, loop
+            f"""
+            SELECT id, staff_role_id, filter, volume, auto_leave, shuffle, loop
             FROM guilds
-            WHERE id = ?
+            WHERE id IN ({", ".join("?" * len(guild_ids))})
         """,
-            (guild_id,),
+            tuple(guild_ids),
         ) as cursor:
-            row: Row = await cursor.fetchone()  # pyright: ignore
+            rows = await cursor.fetchall()
 
-        return Guild(
-            id=guild_id,
-            staff_role_id=row[0],
-            filter=Filter(row[1]),
-            volume=row[2],
-            auto_leave=bool(row[3]),
-            shuffle=bool(row[4]),
-            loop=bool(row[5]),
-        )
+        return [_build_guild(row[0], row[1:]) for row in rows]
 
     async def create_guild(self, guild_id: int) -> Guild:
-        await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id)
-            VALUES (?)
-            ON CONFLICT (id)
-            DO NOTHING
-        """,
-            (guild_id,),
-        )
+        async with self._connection.execute_commited(
+            _CREATE_GUILD_SQL, (guild_id,)
+        ) as cursor:
+            row: Row = await cursor.fetchone()  # pyright: ignore
 
-        return await self.get_guild(guild_id)
+        return _build_guild(guild_id, row)
 
     async def set_guild_staff_role_id(self, guild_id: int, staff_role_id: int) -> None:
         await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id, staff_role_id)
-            VALUES (:id, :staff_role_id)
-            ON CONFLICT (id)
-            DO UPDATE SET staff_role_id = :staff_role_id
-        """,
-            {
-                "id": guild_id,
-                "staff_role_id": staff_role_id,
-            },
+            _SET_GUILD_STAFF_ROLE_ID_SQL, (guild_id, staff_role_id)
         )
 
     async def unset_guild_staff_role_id_if_same(
         self, guild_id: int, expected_staff_role_id: int
     ) -> None:
         await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id)
-            VALUES (:id)
-            ON CONFLICT (id)
-            DO UPDATE SET staff_role_id =
-                CASE WHEN staff_role_id = :expected_staff_role_id
-                    THEN NULL
-                    ELSE staff_role_id
-                END
-        """,
-            {
-                "id": guild_id,
-                "expected_staff_role_id": expected_staff_role_id,
-            },
+            _UNSET_GUILD_STAFF_ROLE_ID_IF_SAME_SQL, (guild_id, expected_staff_role_id)
         )
 
     async def set_guild_filter(self, guild_id: int, filter: Filter) -> None:
         await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id, filter)
-            VALUES (:id, :filter)
-            ON CONFLICT (id)
-            DO UPDATE SET filter = :filter
-        """,
-            {"id": guild_id, "filter": filter.value},
+            _SET_GUILD_FILTER_SQL, (guild_id, filter.value)
         )
 
     async def set_guild_volume(self, guild_id: int, volume: int) -> None:
         await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id, volume)
-            VALUES (:id, :volume)
-            ON CONFLICT (id)
-            DO UPDATE SET volume = :volume
-        """,
-            {"id": guild_id, "volume": volume},
+            _SET_GUILD_VOLUME_SQL, (guild_id, volume)
         )
 
     async def set_guild_auto_leave(self, guild_id: int, auto_leave: bool) -> None:
         await self._connection.execute_auto_closable_commited(
-            """
-            INSERT INTO guilds (id, auto_leave)
-            VALUES (:id, :auto_leave)
-            ON CONFLICT (id)
-            DO UPDATE SET auto_leave = :auto_leave
-        """,
-            {"id": guild_id, "auto_leave": int(auto_leave)},
+            _SET_GUILD_AUTO_LEAVE_SQL, (guild_id, auto_leave)
         )
 
     async def switch_guild_shuffle(self, guild_id: int) -> bool:
-        async with self._connection.execute(
-            """
-            INSERT INTO guilds (id)
-            VALUES (?)
-            ON CONFLICT (id)
-            DO UPDATE SET shuffle = NOT shuffle
-            RETURNING shuffle
-        """,
-            (guild_id,),
+        async with self._connection.execute_commited(
+            _SWITCH_GUILD_SHUFFLE_SQL, (guild_id,)
         ) as cursor:
             row: Row = await cursor.fetchone()  # pyright: ignore
 
         return bool(row[0])
 
     async def switch_guild_loop(self, guild_id: int) -> bool:
-        async with self._connection.execute(
-            """
-            INSERT INTO guilds (id)
-            VALUES (?)
-            ON CONFLICT (id)
-            DO UPDATE SET loop = NOT loop
-            RETURNING loop
-        """,
-            (guild_id,),
+        async with self._connection.execute_commited(
+            _SWITCH_GUILD_LOOP_SQL, (guild_id,)
         ) as cursor:
             row: Row = await cursor.fetchone()  # pyright: ignore
 
         return bool(row[0])
 
     async def get_whitelist(self) -> Whitelist:
-        async with self._connection.execute("""
-            SELECT guild_id FROM whitelist
-        """) as cursor:
-            guild_ids = set()
-            async for row in cursor:
-                guild_ids.add(row[0])
-            return Whitelist(guild_ids)
+        async with self._connection.execute(_GET_WHITELIST_SQL) as cursor:
+            rows = await cursor.fetchall()
+
+        return Whitelist(frozenset(map(itemgetter(0), rows)))
 
     async def add_to_whitelist(self, guild_id: int) -> bool:
         async with self._connection.execute_commited(
-            """
-            INSERT INTO whitelist (guild_id)
-            VALUES (?)
-            ON CONFLICT (guild_id)
-            DO NOTHING
-            RETURNING TRUE
-        """,
-            (guild_id,),
+            _ADD_TO_WHITELIST_SQL, (guild_id,)
         ) as cursor:
             return await cursor.fetchone() is not None
 
     async def remove_from_whitelist(self, guild_id: int) -> bool:
         async with self._connection.execute_commited(
-            """
+            _REMOVE_FROM_WHITELIST_SQL, (guild_id,)
+        ) as cursor:
+            return await cursor.fetchone() is not None
+
+    async def remove_many_from_whitelist(self, guild_ids: Collection[int]) -> set[int]:
+        if not guild_ids:
+            return set()
+
+        async with self._connection.execute_commited(
+            f"""
             DELETE FROM whitelist
-            WHERE guild_id = ?
-            RETURNING TRUE
+            WHERE guild_id IN ({", ".join("?" * len(guild_ids))})
+            RETURNING guild_id
         """,
-            (guild_id,),
+            tuple(guild_ids),
         ) as cursor:
-            return await cursor.fetchone() is not None
+            rows = await cursor.fetchall()
+
+        return set(map(itemgetter(0), rows))
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+import asyncio
 import dataclasses
-from typing import Optional
-from copy import copy
+from collections.abc import Collection, Coroutine
+from functools import partial
+from typing import Any, Optional
 
 from icebeat.notify import Event, Waiter
 
@@ -37,6 +39,9 @@ class Storage(ABC):
     @abstractmethod
     async def get_guild(self, guild_id: int) -> Guild: ...
 
+    @abstractmethod
+    async def get_guilds(self, guild_ids: Collection[int]) -> list[Guild]: ...
+
     @abstractmethod
     async def create_guild(self, guild_id: int) -> Guild: ...
 
@@ -74,23 +79,73 @@ class Storage(ABC):
     @abstractmethod
     async def remove_from_whitelist(self, guild_id: int) -> bool: ...
 
+    @abstractmethod
+    async def remove_many_from_whitelist(
+        self, guild_ids: Collection[int]
+    ) -> set[int]: ...
+
 
 class Store:
-    __slots__ = ("_cache", "_storage", "_whitelist_notifier")
+    __slots__ = (
+        "_cache",
+        "_guild_fetches",
+        "_storage",
+        "_whitelist_fetch",
+        "_whitelist_notifier",
+    )
 
     def __init__(self, cache: Cache, storage: Storage) -> None:
         self._cache = cache
         self._storage = storage
         self._whitelist_notifier = Event()
+        self._guild_fetches: dict[int, asyncio.Task[Guild]] = {}
+        self._whitelist_fetch: asyncio.Task[Whitelist] | None = None
+
+    def _update_cached_guild(self, guild_id: int, **changes: Any) -> None:
+        if guild := self._cache.get_guild(guild_id):
+            self._cache.set_guild(dataclasses.replace(guild, **changes))
+
+    async def _fetch_guild(self, guild_id: int) -> Guild:
+        guild = await self._storage.create_guild(guild_id)
+        self._cache.set_guild(guild)
+
+        return guild
+
+    def _drop_guild_on_failed_write(
+        self, guild_id: int, write: asyncio.Future[None]
+    ) -> None:
+        if write.cancelled() or write.exception():
+            self._cache.invalidate_guild(guild_id)
+
+    async def _write_guild(
+        self, guild_id: int, write: Coroutine[Any, Any, None], **changes: Any
+    ) -> None:
+        # The cache is patched before the write lands. If the write fails, the
+        # entry is dropped rather than restored, since concurrent writes may
+        # have patched other fields meanwhile; the next read reloads it. The
+        # callback runs even if the caller is cancelled while waiting.
+        if guild := self._cache.get_guild(guild_id):
+            self._cache.set_guild(dataclasses.replace(guild, **changes))
+
+        write_task = asyncio.ensure_future(write)
+        write_task.add_done_callback(
+            partial(self._drop_guild_on_failed_write, guild_id)
+        )
+
+        await asyncio.shield(write_task)
 
     async def get_guild(self, guild_id: int) -> Guild:
-        guild = self._cache.get_guild(guild_id)
+        if guild := self._cache.get_guild(guild_id):
+            return guild
 
-        if not guild:
-            guild = await self._storage.create_guild(guild_id)
-            self._cache.set_guild(guild)
+        # Concurrent misses for the same guild wait on a single fetch.
+        if not (fetch := self._guild_fetches.get(guild_id)):
+            fetch = self._guild_fetches[guild_id] = asyncio.ensure_future(
+                self._fetch_guild(guild_id)
+            )
+            fetch.add_done_callback(lambda _: self._guild_fetches.pop(guild_id, None))
 
-        return dataclasses.replace(guild)
+        return await asyncio.shield(fetch)
 
     async def prepare(self) -> None:
         await self._storage.prepare()
@@ -98,10 +153,16 @@ class Store:
     async def create_guild(self, guild_id: int) -> None:
         await self.get_guild(guild_id)
 
-    async def set_guild_staff_role_id(self, guild_id: int, staff_role_id: int) -> None:
-        await self._storage.set_guild_staff_role_id(guild_id, staff_role_id)
+    async def warm_up_guilds(self, guild_ids: Collection[int]) -> None:
+        for guild in await self._storage.get_guilds(guild_ids):
+            self._cache.set_guild(guild)
 
-        self._cache.invalidate_guild(guild_id)
+    async def set_guild_staff_role_id(self, guild_id: int, staff_role_id: int) -> None:
+        await self._write_guild(
+            guild_id,
+            self._storage.set_guild_staff_role_id(guild_id, staff_role_id),
+            staff_role_id=staff_role_id,
+        )
 
     async def unset_guild_staff_role_id_if_same(
         self, guild_id: int, expected_staff_role_id: int
@@ -110,52 +171,75 @@ class Store:
             guild_id, expected_staff_role_id
         )
 
-        self._cache.invalidate_guild(guild_id)
+        if (
+            guild := self._cache.get_guild(guild_id)
+        ) and guild.staff_role_id == expected_staff_role_id:
+            self._cache.set_guild(dataclasses.replace(guild, staff_role_id=None))
 
     async def set_guild_filter(self, guild_id: int, filter: Filter) -> None:
-        await self._storage.set_guild_filter(guild_id, filter)
-
-        self._cache.invalidate_guild(guild_id)
+        await self._write_guild(
+            guild_id, self._storage.set_guild_filter(guild_id, filter), filter=filter
+        )
 
     async def set_guild_volume(self, guild_id: int, *, volume: int) -> None:
-        await self._storage.set_guild_volume(guild_id, volume)
-
-        self._cache.invalidate_guild(guild_id)
+        await self._write_guild(
+            guild_id, self._storage.set_guild_volume(guild_id, volume), volume=volume
+        )
 
     async def set_guild_auto_leave(self, guild_id: int, *, auto_leave: bool) -> None:
-        await self._storage.set_guild_auto_leave(guild_id, auto_leave)
-
-        self._cache.invalidate_guild(guild_id)
+        await self._write_guild(
+            guild_id,
+            self._storage.set_guild_auto_leave(guild_id, auto_leave),
+            auto_leave=auto_leave,
+        )
 
     async def switch_guild_shuffle(self, guild_id: int) -> bool:
         shuffle = await self._storage.switch_guild_shuffle(guild_id)
 
-        self._cache.invalidate_guild(guild_id)
+        self._update_cached_guild(guild_id, shuffle=shuffle)
 
         return shuffle
 
     async def switch_guild_loop(self, guild_id: int) -> bool:
         loop = await self._storage.switch_guild_loop(guild_id)
 
-        self._cache.invalidate_guild(guild_id)
+        self._update_cached_guild(guild_id, loop=loop)
 
         return loop
 
+    async def _fetch_whitelist(self) -> Whitelist:
+        whitelist = await self._storage.get_whitelist()
+        self._cache.set_whitelist(whitelist)
+
+        return whitelist
+
+    def _clear_whitelist_fetch(self, _: asyncio.Task[Whitelist]) -> None:
+        self._whitelist_fetch = None
+
     async def get_whitelist(self) -> Whitelist:
-        whitelist = self._cache.get_whitelist()
+        if whitelist := self._cache.get_whitelist():
+            return whitelist
+
+        if not (fetch := self._whitelist_fetch):
+            fetch = self._whitelist_fetch = asyncio.ensure_future(
+                self._fetch_whitelist()
+            )
+            fetch.add_done_callback(self._clear_whitelist_fetch)
+
+        return await asyncio.shield(fetch)
 
-        if not whitelist:
-            whitelist = await self._storage.get_whitelist()
-            self._cache.set_whitelist(whitelist)
+    async def is_whitelisted(self, guild_id: int) -> bool:
+        whitelist = await self.get_whitelist()
 
-        return Whitelist(copy(whitelist.guild_ids))
+        return guild_id in whitelist.guild_ids
 
     async def add_to_whitelist(self, guild_id: int) -> bool:
         inserted = await self._storage.add_to_whitelist(guild_id)
 
-        self._cache.invalidate_whitelist()
-
         if inserted:
+            if whitelist := self._cache.get_whitelist():
+                self._cache.set_whitelist(Whitelist(whitelist.guild_ids | {guild_id}))
+
             self._whitelist_notifier.notify()
 
         return inserted
@@ -163,9 +247,21 @@ class Store:
     async def remove_from_whitelist(self, guild_id: int) -> bool:
         removed = await self._storage.remove_from_whitelist(guild_id)
 
-        self._cache.invalidate_whitelist()
+        if removed:
+            if whitelist := self._cache.get_whitelist():
+                self._cache.set_whitelist(Whitelist(whitelist.guild_ids - {guild_id}))
+
+            self._whitelist_notifier.notify()
+
+        return removed
+
+    async def remove_many_from_whitelist(self, guild_ids: Collection[int]) -> set[int]:
+        removed = await self._storage.remove_many_from_whitelist(guild_ids)
 
         if removed:
+            if whitelist := self._cache.get_whitelist():
+                self._cache.set_whitelist(Whitelist(whitelist.guild_ids - removed))
+
             self._whitelist_notifier.notify()
 
         return removed
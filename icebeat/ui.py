@@ -20,7 +20,7 @@ __log__ = logging.getLogger(__name__)
 
 
 def compute_total_pages(total_elements: int, elements_per_page: int) -> int:
-    return ((total_elements - 1) // elements_per_page) + 1
+    return -(-total_elements // elements_per_page)
 
 
 class Page(ABC):
@@ -41,19 +41,26 @@ class _BasePagination(ABC, View):
     __slots__ = (
         "_navigated",
         "_page",
+        "_allowed_user_id",
         "_current_page",
         "_total_pages",
+        "_buttons_state",
+        "_previous_button",
+        "_next_button",
         "_edit_page_lock",
         "_dynamic_edit_page_task",
     )
 
-    def __init__(self, timeout: float, page: Page) -> None:
+    def __init__(self, timeout: float, page: Page, allowed_user_id: int) -> None:
         super().__init__(timeout=timeout)
 
         self._navigated = False
         self._page = page
+        self._allowed_user_id = allowed_user_id
         self._current_page = 1
         self._total_pages = 1
+        self._buttons_state = (False, False)
+        self._previous_button, self._next_button = self.children[:2]
         self._edit_page_lock = asyncio.Lock()
         self._dynamic_edit_page_task: asyncio.Task
 
@@ -69,16 +76,24 @@ class _BasePagination(ABC, View):
     async def _edit_message(self, *, embed: Embed, view: Optional[View]) -> None: ...
 
     def _update_buttons(self) -> None:
-        self.children[0].disabled = self._current_page == 1  # pyright: ignore[reportAttributeAccessIssue]
-        self.children[1].disabled = self._current_page == self._total_pages  # pyright: ignore[reportAttributeAccessIssue]
+        buttons_state = (
+            self._current_page == 1,
+            self._current_page == self._total_pages,
+        )
+        if buttons_state == self._buttons_state:
+            return
+        self._buttons_state = buttons_state
+
+        self._previous_button.disabled, self._next_button.disabled = buttons_state  # pyright: ignore[reportAttributeAccessIssue]
 
     async def _update_page(self) -> tuple[Embed, bool]:
         embed, self._current_page, self._total_pages, empty = await self._page.fetch(
             self._current_page
         )
-        assert self._current_page > 0
-        assert self._total_pages > 0
-        assert self._current_page <= self._total_pages
+        if not 0 < self._current_page <= self._total_pages:
+            raise ValueError(
+                f"page {self._current_page} is out of range 1-{self._total_pages}"
+            )
 
         self._update_buttons()
 
@@ -128,6 +143,10 @@ class _BasePagination(ABC, View):
     async def previous(self, interaction: Interaction, button: Button) -> None:
         _ = button
 
+        if self._current_page == 1:
+            await interaction.response.defer()
+            return
+
         self._current_page -= 1
 
         await self._edit_page(interaction)
@@ -136,10 +155,18 @@ class _BasePagination(ABC, View):
     async def next(self, interaction: Interaction, button: Button) -> None:
         _ = button
 
+        if self._current_page >= self._total_pages:
+            await interaction.response.defer()
+            return
+
         self._current_page += 1
 
         await self._edit_page(interaction)
 
+    @override
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        return interaction.user.id == self._allowed_user_id
+
     @override
     async def on_error(
         self, interaction: Interaction, error: Exception, item: Item, /
@@ -183,14 +210,10 @@ class ContextPagination(_BasePagination):
         page: Page,
         ctx: commands.Context,
     ) -> None:
-        super().__init__(timeout, page)
+        super().__init__(timeout, page, ctx.author.id)
 
         self._ctx = ctx
 
-    @override
-    async def interaction_check(self, interaction: Interaction) -> bool:
-        return self._ctx.author.id == interaction.user.id
-
     async def _send_message(
         self,
         *,
@@ -215,14 +238,10 @@ class InteractionPagination(_BasePagination):
         page: Page,
         interaction: Interaction,
     ) -> None:
-        super().__init__(timeout, page)
+        super().__init__(timeout, page, interaction.user.id)
 
         self._interaction = interaction
 
-    @override
-    async def interaction_check(self, interaction: Interaction) -> bool:
-        return self._interaction.user.id == interaction.user.id
-
     async def _send_message(
         self,
         *,
@@ -26,6 +26,9 @@ class LavalinkVoiceClient(VoiceProtocol):
         self._destroyed = False
         self._guild = self.channel.guild
 
+    def _get_player(self) -> IceBeatPlayer | None:
+        return self._lavalink_client.player_manager.get(self._guild.id)  # pyright: ignore[reportReturnType]
+
     async def _destroy(self) -> None:
         self.cleanup()
 
@@ -49,13 +52,13 @@ class LavalinkVoiceClient(VoiceProtocol):
         channel_id = int(raw_channel_id)
         self.channel: VoiceChannel = self.client.get_channel(channel_id)  # pyright: ignore[reportAttributeAccessIssue, reportIncompatibleVariableOverride]
 
-        payload = {"t": "VOICE_STATE_UPDATE", "d": data}
-        await self._lavalink_client.voice_update_handler(payload)  # pyright: ignore[reportArgumentType]
+        if player := self._get_player():
+            await player._voice_state_update(data)  # pyright: ignore[reportPrivateUsage, reportArgumentType]
 
     @override
     async def on_voice_server_update(self, data: VoiceServerUpdatePayload) -> None:
-        payload = {"t": "VOICE_SERVER_UPDATE", "d": data}
-        await self._lavalink_client.voice_update_handler(payload)  # pyright: ignore[reportArgumentType]
+        if player := self._get_player():
+            await player._voice_server_update(data)  # pyright: ignore[reportPrivateUsage, reportArgumentType]
 
     @override
     async def connect(
@@ -0,0 +1,35 @@
+import unittest
+
+from icebeat.cogs.music import _parse_seek_time
+
+
+class ParseSeekTimeTest(unittest.TestCase):
+    def test_valid_positions(self) -> None:
+        for value, position in (
+            ("0:05", 5_000),
+            ("7:30", 450_000),
+            ("12:00", 720_000),
+            ("1:02:03", 3_723_000),
+            ("10:00:00", 36_000_000),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(_parse_seek_time(value), position)
+
+    def test_malformed_positions(self) -> None:
+        for value in ("", "5", ":05", "05:00", "1:5", "0:01:00", "1:2:03", "a:00"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_seek_time(value))
+
+    def test_non_ascii_digits_are_rejected(self) -> None:
+        for value in ("٣0:00", "3:٠٠", "١:00:00", "１:00"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_seek_time(value))
+
+    def test_trailing_newline_is_rejected(self) -> None:
+        for value in ("1:00\n", "1:00:00\n"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_seek_time(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
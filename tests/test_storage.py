@@ -0,0 +1,76 @@
+import asyncio
+import sqlite3
+import unittest
+from pathlib import Path
+
+import aiosqlite
+
+from icebeat.storage import SQLiteStorage
+
+_MIGRATIONS = Path(__file__).parent.parent / "db" / "migrations"
+
+
+class GroupCommitTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.connection = await aiosqlite.connect(":memory:")
+        for migration in sorted(_MIGRATIONS.glob("*.up.sql")):
+            await self.connection.executescript(migration.read_text())
+
+        self.storage = SQLiteStorage(self.connection)
+        await self.storage.prepare()
+
+    async def asyncTearDown(self) -> None:
+        await self.connection.close()
+
+    async def _committed_whitelist(self) -> frozenset[int]:
+        # Anything left in the open transaction wasn't actually written.
+        await self.connection.rollback()
+
+        return (await self.storage.get_whitelist()).guild_ids
+
+    async def test_write_during_failed_commit_is_persisted(self) -> None:
+        commit = self.connection.commit
+        commit_started = asyncio.Event()
+        failed = False
+
+        async def flaky_commit() -> None:
+            nonlocal failed
+
+            if failed:
+                return await commit()
+            failed = True
+
+            commit_started.set()
+            await asyncio.sleep(0.05)
+            raise sqlite3.OperationalError("disk I/O error")
+
+        self.connection.commit = flaky_commit  # pyright: ignore
+
+        first_write = asyncio.ensure_future(self.storage.add_to_whitelist(1))
+        await commit_started.wait()
+
+        self.assertTrue(await self.storage.add_to_whitelist(2))
+        with self.assertRaises(sqlite3.OperationalError):
+            await first_write
+
+        self.assertEqual(await self._committed_whitelist(), {2})
+
+    async def test_failed_commit_fails_every_grouped_write(self) -> None:
+        async def failing_commit() -> None:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        self.connection.commit = failing_commit  # pyright: ignore
+
+        results = await asyncio.gather(
+            self.storage.add_to_whitelist(1),
+            self.storage.add_to_whitelist(2),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            self.assertIsInstance(result, sqlite3.OperationalError)
+        self.assertEqual(await self._committed_whitelist(), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()